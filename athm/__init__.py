@@ -3,6 +3,7 @@
 A modern Python library for integrating with the ATH Móvil payment API.
 """
 
+from athm.async_client import AsyncATHMovilClient
 from athm.client import ATHMovilClient
 from athm.exceptions import (
     ATHMovilError,
@@ -41,6 +42,7 @@ __email__ = "raul.esteban.negron@gmail.com"
 __all__ = [
     "ATHMovilClient",
     "ATHMovilError",
+    "AsyncATHMovilClient",
     "AuthenticationError",
     "FieldError",
     "InternalServerError",
@@ -0,0 +1,223 @@
+"""Shared configuration and response handling for the ATH Móvil clients."""
+
+import secrets
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Generic, TypeVar
+
+import httpx
+
+from athm import _json
+from athm.constants import (
+    BASE_URL,
+    DEFAULT_HEADERS,
+    ENDPOINTS,
+    KEEPALIVE_EXPIRY,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+    MAX_POLLING_INTERVAL,
+    MAX_RETRIES,
+    MAX_STORED_AUTH_TOKENS,
+    POLLING_JITTER,
+    REQUEST_TIMEOUT,
+    RETRY_BASE,
+    RETRY_CAP,
+    RETRYABLE_STATUS_CODES,
+    UNPROCESSED_STATUS_CODES,
+)
+from athm.exceptions import (
+    ATHMovilError,
+    NetworkError,
+    TimeoutError,
+    ValidationError,
+    create_exception_from_response,
+)
+
+_HTTPClientT = TypeVar("_HTTPClientT", httpx.Client, httpx.AsyncClient)
+
+_random = secrets.SystemRandom()
+
+# Pre-encoded body for endpoints that take an empty JSON object
+_EMPTY_JSON = b"{}"
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delay-seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class BaseATHMovilClient(Generic[_HTTPClientT]):
+    """Configuration and transport-independent logic shared by the sync and async clients."""
+
+    __slots__ = (
+        "_auth_tokens",
+        "_endpoint_urls",
+        "_http_client",
+        "_owns_http_client",
+        "base_url",
+        "max_retries",
+        "private_token",
+        "public_token",
+        "timeout",
+        "verify_ssl",
+    )
+
+    def __init__(
+        self,
+        public_token: str,
+        private_token: str | None = None,
+        base_url: str = BASE_URL,
+        timeout: float | int | None = REQUEST_TIMEOUT,
+        max_retries: int = MAX_RETRIES,
+        verify_ssl: bool = True,
+        http_client: _HTTPClientT | None = None,
+    ) -> None:
+        """Initialize the ATH Móvil client.
+
+        Args:
+            public_token: Your ATH Business public token
+            private_token: Your ATH Business private token (optional)
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            max_retries: Maximum retry attempts
+            verify_ssl: Whether to verify SSL certificates
+            http_client: Existing httpx client to send requests through, e.g. one
+                shared across client instances. It is not closed by this client,
+                and timeout/verify_ssl are not applied to it.
+
+        Raises:
+            ValidationError: If public_token is empty
+        """
+        if not public_token or not public_token.strip():
+            raise ValidationError("public_token is required and cannot be empty")
+
+        self.public_token = public_token
+        self.private_token = private_token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.verify_ssl = verify_ssl
+
+        self._http_client: _HTTPClientT | None = http_client
+        self._owns_http_client = http_client is None
+        self._auth_tokens: OrderedDict[str, str] = OrderedDict()
+        # Absolute URLs are parsed once and sent as-is, so httpx doesn't have to
+        # parse the path and join it with base_url on every request
+        self._endpoint_urls = {
+            name: httpx.URL(f"{self.base_url}{path}") for name, path in ENDPOINTS.items()
+        }
+
+    def _client_options(self) -> dict[str, Any]:
+        # One HTTP/2 connection is multiplexed across calls to the payments host,
+        # so polling and create/authorize sequences skip repeated TLS handshakes.
+        return {
+            "base_url": self.base_url,
+            "headers": DEFAULT_HEADERS,
+            "timeout": self.timeout,
+            "verify": self.verify_ssl,
+            "http2": True,
+            "limits": httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        }
+
+    def _prepare_headers(self, auth_token: str | None = None) -> Mapping[str, str] | None:
+        # Clients created here already send DEFAULT_HEADERS, so only the
+        # Authorization override is passed per request; a caller-supplied client
+        # needs the defaults on every request.
+        if auth_token:
+            # Built per request so bearer tokens aren't kept alive in a shared cache
+            headers = {"Authorization": "Bearer " + auth_token}
+            return headers if self._owns_http_client else {**DEFAULT_HEADERS, **headers}
+        return None if self._owns_http_client else DEFAULT_HEADERS
+
+    def _store_auth_token(self, ecommerce_id: str, auth_token: str) -> None:
+        # Tokens are only removed by cancel_payment, so evict the least recently
+        # used ones to keep long-running processes from growing without bound.
+        self._auth_tokens[ecommerce_id] = auth_token
+        self._auth_tokens.move_to_end(ecommerce_id)
+        if len(self._auth_tokens) > MAX_STORED_AUTH_TOKENS:
+            self._auth_tokens.popitem(last=False)
+
+    def _stored_auth_token(self, ecommerce_id: str) -> str | None:
+        auth_token = self._auth_tokens.get(ecommerce_id)
+        if auth_token is not None:
+            self._auth_tokens.move_to_end(ecommerce_id)
+        return auth_token
+
+    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
+        try:
+            data: dict[str, Any] = _json.loads(response.content)
+        except ValueError as e:
+            raise NetworkError(
+                f"Invalid JSON response: {e}",
+                status_code=response.status_code,
+            ) from e
+
+        if response.status_code < 400 and data.get("status") != "error":
+            return data
+
+        raise create_exception_from_response(data, response.status_code)
+
+    @staticmethod
+    def _ecommerce_status(response: dict[str, Any]) -> str | None:
+        data = response.get("data")
+        if isinstance(data, dict):
+            status = data.get("ecommerceStatus")
+            return status if isinstance(status, str) else None
+        return None
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        # Full jitter spreads retries from concurrent clients across the whole
+        # backoff window instead of having them wake up together.
+        delay = _random.uniform(0, min(RETRY_CAP, RETRY_BASE * 2**attempt))
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, RETRY_CAP))
+        return delay
+
+    @staticmethod
+    def _polling_delay(interval: float, remaining: float) -> float:
+        return min(interval * (1 + _random.uniform(0, POLLING_JITTER)), remaining)
+
+    @staticmethod
+    def _next_polling_interval(interval: float) -> float:
+        # Confirmation usually takes a while, so back off instead of polling at a fixed rate
+        return min(MAX_POLLING_INTERVAL, interval * 2)
+
+    @staticmethod
+    def _can_retry(exc: httpx.TransportError, idempotent: bool) -> bool:
+        # Requests that may have reached the server are only resent when doing so
+        # can't duplicate a payment or refund; connection failures are always safe.
+        return idempotent or isinstance(
+            exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+        )
+
+    @staticmethod
+    def _can_retry_status(status_code: int, idempotent: bool) -> bool:
+        # A 503 may come back after the server acted on the request, so resending
+        # a payment or refund could duplicate it; only rate limiting is always safe.
+        if idempotent:
+            return status_code in RETRYABLE_STATUS_CODES
+        return status_code in UNPROCESSED_STATUS_CODES
+
+    def _transport_error(self, exc: httpx.TransportError) -> ATHMovilError:
+        error_class = TimeoutError if isinstance(exc, httpx.TimeoutException) else NetworkError
+        return error_class(f"{type(exc).__name__}: {exc}")
@@ -0,0 +1,8 @@
+"""JSON decoding that uses orjson when it is installed."""
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads  # type: ignore[assignment]
+
+__all__ = ["loads"]
@@ -0,0 +1,483 @@
+"""Asynchronous ATH Móvil API Client implementation."""
+
+import asyncio
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from pydantic import ValidationError as PydanticValidationError
+
+from athm._base_client import _EMPTY_JSON, BaseATHMovilClient
+from athm.constants import (
+    DEFAULT_HEADERS,
+    WEBHOOK_BASE_URL,
+    WEBHOOK_SUBSCRIBE_ENDPOINT,
+)
+from athm.exceptions import (
+    AuthenticationError,
+    NetworkError,
+    TimeoutError,
+    TransactionError,
+    ValidationError,
+)
+from athm.models import (
+    CancelPaymentRequest,
+    FindPaymentRequest,
+    PaymentItem,
+    PaymentRequest,
+    PaymentResponse,
+    RefundRequest,
+    RefundResponse,
+    SuccessResponse,
+    TransactionResponse,
+    TransactionStatus,
+    UpdatePhoneRequest,
+    WebhookSubscriptionRequest,
+)
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class AsyncATHMovilClient(BaseATHMovilClient[httpx.AsyncClient]):
+    """Asynchronous client for interacting with ATH Móvil Payment API.
+
+    Mirrors ATHMovilClient on top of httpx.AsyncClient, so many payments can be
+    polled concurrently from a single event loop.
+
+    Attributes:
+        public_token: Your ATH Business public token
+        private_token: Your ATH Business private token (optional, required for refunds)
+        base_url: API base URL (defaults to production)
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts
+        verify_ssl: Whether to verify SSL certificates
+    """
+
+    __slots__ = ()
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**self._client_options())
+
+    async def __aenter__(self) -> "Self":
+        """Enter async context manager."""
+        if self._http_client is None:
+            self._http_client = self._create_client()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context manager."""
+        await self.aclose()
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Lazily initialize and return the HTTP client."""
+        if self._http_client is None:
+            self._http_client = self._create_client()
+        return self._http_client
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str | httpx.URL,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
+        idempotent: bool = False,
+    ) -> dict[str, Any]:
+        # URL and header merging happen once here; retries resend the same request.
+        request = self.async_client.build_request(
+            method=method,
+            url=endpoint,
+            content=content,
+            headers=headers if headers is not None else self._prepare_headers(),
+        )
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.async_client.send(request)
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                if attempt >= self.max_retries or not self._can_retry(e, idempotent):
+                    raise self._transport_error(e) from e
+
+                await asyncio.sleep(self._retry_delay(attempt))
+                attempt += 1
+                continue
+            except httpx.HTTPError as e:
+                raise NetworkError(f"HTTP error: {e}") from e
+
+            if attempt < self.max_retries and self._can_retry_status(
+                response.status_code, idempotent
+            ):
+                await asyncio.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+                continue
+
+            return self._handle_response(response)
+
+    async def create_payment(
+        self,
+        total: str,
+        phone_number: str,
+        items: list[PaymentItem],
+        **kwargs: Any,
+    ) -> PaymentResponse:
+        """Create a payment ticket.
+
+        Args:
+            total: Total amount (1.00 to 1500.00)
+            phone_number: Customer phone number (10 digits)
+            items: List of payment items
+            **kwargs: Additional payment fields (tax, subtotal, metadata1, metadata2, timeout)
+
+        Returns:
+            PaymentResponse with ecommerce_id and auth_token
+
+        Raises:
+            ValidationError: On invalid input
+            ATHMovilError: On API errors
+        """
+        try:
+            request_data = PaymentRequest(
+                public_token=self.public_token,
+                total=total,
+                phone_number=phone_number,
+                items=items,
+                **kwargs,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="payment request") from e
+
+        response = await self._make_request(
+            "POST",
+            self._endpoint_urls["payment"],
+            content=request_data.model_dump_json(by_alias=True, exclude_none=True).encode(),
+        )
+
+        payment_response = PaymentResponse(**response)
+        self._store_auth_token(payment_response.data.ecommerce_id, payment_response.data.auth_token)
+
+        return payment_response
+
+    async def _find_payment_data(self, ecommerce_id: str) -> dict[str, Any]:
+        try:
+            request_data = FindPaymentRequest(
+                ecommerce_id=ecommerce_id,
+                public_token=self.public_token,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="payment lookup") from e
+
+        return await self._make_request(
+            "POST",
+            self._endpoint_urls["find_payment"],
+            content=request_data.model_dump_json(by_alias=True).encode(),
+            idempotent=True,
+        )
+
+    async def find_payment(self, ecommerce_id: str) -> TransactionResponse:
+        """Check payment status.
+
+        Args:
+            ecommerce_id: The payment ID to check
+
+        Returns:
+            TransactionResponse with current status
+
+        Raises:
+            ATHMovilError: On API errors
+        """
+        response = await self._find_payment_data(ecommerce_id)
+
+        return TransactionResponse(**response)
+
+    async def authorize_payment(
+        self,
+        ecommerce_id: str,
+        auth_token: str | None = None,
+    ) -> TransactionResponse:
+        """Authorize and complete a confirmed payment.
+
+        Args:
+            ecommerce_id: The payment ID to authorize
+            auth_token: JWT token from create_payment (if not stored internally)
+
+        Returns:
+            TransactionResponse with completed transaction details
+
+        Raises:
+            AuthenticationError: If no auth token available
+            ATHMovilError: On API errors
+        """
+        token = auth_token or self._stored_auth_token(ecommerce_id)
+        if not token:
+            raise AuthenticationError(
+                "No auth token available. Create payment first or provide auth_token."
+            )
+
+        headers = self._prepare_headers(auth_token=token)
+
+        response = await self._make_request(
+            "POST",
+            self._endpoint_urls["authorization"],
+            content=_EMPTY_JSON,
+            headers=headers,
+        )
+
+        return TransactionResponse(**response)
+
+    async def update_phone_number(
+        self,
+        ecommerce_id: str,
+        phone_number: str,
+        auth_token: str | None = None,
+    ) -> SuccessResponse:
+        """Update the phone number for a payment notification.
+
+        Args:
+            ecommerce_id: The payment ID
+            phone_number: New phone number (10 digits)
+            auth_token: JWT token (if not stored internally)
+
+        Returns:
+            SuccessResponse
+
+        Raises:
+            AuthenticationError: If no auth token available
+            ValidationError: On invalid phone number
+            ATHMovilError: On API errors
+        """
+        token = auth_token or self._stored_auth_token(ecommerce_id)
+        if not token:
+            raise AuthenticationError("No auth token available")
+
+        try:
+            request_data = UpdatePhoneRequest(
+                ecommerce_id=ecommerce_id,
+                phone_number=phone_number,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="phone number") from e
+
+        headers = self._prepare_headers(auth_token=token)
+
+        response = await self._make_request(
+            "PUT",
+            self._endpoint_urls["update_phone"],
+            content=request_data.model_dump_json(by_alias=True).encode(),
+            headers=headers,
+            idempotent=True,
+        )
+
+        return SuccessResponse(**response)
+
+    async def cancel_payment(self, ecommerce_id: str) -> SuccessResponse:
+        """Cancel an open payment.
+
+        Args:
+            ecommerce_id: The payment ID to cancel
+
+        Returns:
+            SuccessResponse
+
+        Raises:
+            ATHMovilError: On API errors
+        """
+        try:
+            request_data = CancelPaymentRequest(
+                ecommerce_id=ecommerce_id,
+                public_token=self.public_token,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="cancel request") from e
+
+        response = await self._make_request(
+            "POST",
+            self._endpoint_urls["cancel"],
+            content=request_data.model_dump_json(by_alias=True).encode(),
+            idempotent=True,
+        )
+
+        self._auth_tokens.pop(ecommerce_id, None)
+
+        return SuccessResponse(**response)
+
+    async def refund_payment(
+        self,
+        reference_number: str,
+        amount: str,
+        message: str | None = None,
+    ) -> RefundResponse:
+        """Process a refund for a completed transaction.
+
+        Args:
+            reference_number: Original transaction reference
+            amount: Amount to refund
+            message: Optional refund message (max 50 chars)
+
+        Returns:
+            RefundResponse with refund details
+
+        Raises:
+            AuthenticationError: If private_token not configured
+            ValidationError: On invalid input
+            ATHMovilError: On API errors
+        """
+        if not self.private_token:
+            raise AuthenticationError("Private token required for refunds")
+
+        try:
+            request_data = RefundRequest(
+                public_token=self.public_token,
+                private_token=self.private_token,
+                reference_number=reference_number,
+                amount=amount,
+                message=message,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="refund request") from e
+
+        response = await self._make_request(
+            "POST",
+            self._endpoint_urls["refund"],
+            content=request_data.model_dump_json(by_alias=True, exclude_none=True).encode(),
+        )
+
+        return RefundResponse(**response)
+
+    async def wait_for_confirmation(
+        self,
+        ecommerce_id: str,
+        timeout: int = 300,
+        polling_interval: float = 2.0,
+    ) -> bool:
+        """Wait for customer to confirm payment.
+
+        Polls payment status until customer confirms or timeout is reached,
+        yielding to the event loop between checks. The wait between polls starts
+        at polling_interval and doubles after each check, up to 15 seconds.
+
+        Args:
+            ecommerce_id: The payment ID from create_payment()
+            timeout: Maximum seconds to wait (default: 300)
+            polling_interval: Initial seconds between status checks (default: 2.0)
+
+        Returns:
+            True if payment was confirmed
+
+        Raises:
+            TimeoutError: If timeout exceeded without confirmation
+            TransactionError: If payment was cancelled
+
+        Example:
+            >>> async with AsyncATHMovilClient(public_token="...") as client:
+            ...     await asyncio.gather(
+            ...         *(client.wait_for_confirmation(eid) for eid in ecommerce_ids)
+            ...     )
+        """
+        deadline = time.monotonic() + timeout
+        interval = polling_interval
+        remaining = float(timeout)
+        # A non-positive timeout gives up without polling
+        while remaining > 0:
+            # Only the status is needed here, so skip building a TransactionResponse
+            status = self._ecommerce_status(await self._find_payment_data(ecommerce_id))
+
+            if status == TransactionStatus.CONFIRM:
+                return True
+            elif status == TransactionStatus.CANCEL:
+                raise TransactionError(
+                    "Payment was cancelled",
+                    error_code="PAYMENT_CANCELLED",
+                )
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            await asyncio.sleep(self._polling_delay(interval, remaining))
+            interval = self._next_polling_interval(interval)
+
+        raise TimeoutError(
+            f"Payment not confirmed within {timeout} seconds",
+            error_code="POLLING_TIMEOUT",
+        )
+
+    async def aclose(self) -> None:
+        """Close HTTP client and cleanup resources.
+
+        A client passed in as http_client is left open for its owner to close.
+        """
+        if self._http_client and self._owns_http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def subscribe_webhook(
+        self,
+        listener_url: str,
+        *,
+        payment_received: bool = True,
+        refund_sent: bool = True,
+        donation_received: bool = False,
+        ecommerce_completed: bool = True,
+        ecommerce_cancelled: bool = True,
+        ecommerce_expired: bool = True,
+    ) -> dict[str, Any]:
+        """Subscribe to ATH Movil webhook events.
+
+        Registers a webhook listener URL to receive transaction notifications.
+        Requires private_token to be configured on the client.
+
+        Ref: https://github.com/evertec/athmovil-webhooks#subscribe-via-web-service
+
+        Args:
+            listener_url: HTTPS URL to receive webhook POST requests
+            payment_received: Subscribe to payment notifications (default: True)
+            refund_sent: Subscribe to refund notifications (default: True)
+            donation_received: Subscribe to donation notifications (default: False)
+            ecommerce_completed: Subscribe to eCommerce completed events (default: True)
+            ecommerce_cancelled: Subscribe to eCommerce cancelled events (default: True)
+            ecommerce_expired: Subscribe to eCommerce expired events (default: True)
+
+        Returns:
+            API response dict
+
+        Raises:
+            AuthenticationError: If private_token not configured
+            ValidationError: If listener_url is invalid
+            ATHMovilError: On API errors
+        """
+        if not self.private_token:
+            raise AuthenticationError("private_token is required to subscribe to webhooks")
+
+        try:
+            request = WebhookSubscriptionRequest(
+                public_token=self.public_token,
+                private_token=self.private_token,
+                listener_url=listener_url,
+                payment_received_event=payment_received,
+                refund_sent_event=refund_sent,
+                donation_received_event=donation_received,
+                ecommerce_payment_received_event=ecommerce_completed,
+                ecommerce_payment_cancelled_event=ecommerce_cancelled,
+                ecommerce_payment_expired_event=ecommerce_expired,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="webhook subscription") from e
+
+        # Webhook subscription uses a different base URL than the payment API
+        url = f"{WEBHOOK_BASE_URL}{WEBHOOK_SUBSCRIBE_ENDPOINT}"
+
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.post(
+                    url,
+                    content=request.model_dump_json(by_alias=True).encode(),
+                    headers=DEFAULT_HEADERS,
+                )
+            return self._handle_response(response)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"Webhook subscription request timed out: {e}") from e
+        except httpx.HTTPError as e:
+            raise NetworkError(f"HTTP error during webhook subscription: {e}") from e
@@ -1,19 +1,15 @@
 """ATH Móvil API Client implementation."""
 
-import json
 import time
-from typing import Any
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from pydantic import ValidationError as PydanticValidationError
-from typing_extensions import Self
 
+from athm._base_client import _EMPTY_JSON, BaseATHMovilClient
 from athm.constants import (
-    BASE_URL,
     DEFAULT_HEADERS,
-    ENDPOINTS,
-    MAX_RETRIES,
-    REQUEST_TIMEOUT,
     WEBHOOK_BASE_URL,
     WEBHOOK_SUBSCRIBE_ENDPOINT,
 )
@@ -23,7 +19,6 @@ from athm.exceptions import (
     TimeoutError,
     TransactionError,
     ValidationError,
-    create_exception_from_response,
 )
 from athm.models import (
     CancelPaymentRequest,
@@ -40,8 +35,11 @@ from athm.models import (
     WebhookSubscriptionRequest,
 )
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
-class ATHMovilClient:
+
+class ATHMovilClient(BaseATHMovilClient[httpx.Client]):
     """Client for interacting with ATH Móvil Payment API.
 
     This client provides synchronous methods for all ATH Móvil API operations.
@@ -55,117 +53,66 @@ class ATHMovilClient:
         verify_ssl: Whether to verify SSL certificates
     """
 
-    def __init__(
-        self,
-        public_token: str,
-        private_token: str | None = None,
-        base_url: str = BASE_URL,
-        timeout: float | int | None = REQUEST_TIMEOUT,
-        max_retries: int = MAX_RETRIES,
-        verify_ssl: bool = True,
-    ) -> None:
-        """Initialize the ATH Móvil client.
-
-        Args:
-            public_token: Your ATH Business public token
-            private_token: Your ATH Business private token (optional)
-            base_url: API base URL
-            timeout: Request timeout in seconds
-            max_retries: Maximum retry attempts
-            verify_ssl: Whether to verify SSL certificates
-
-        Raises:
-            ValidationError: If public_token is empty
-        """
-        if not public_token or not public_token.strip():
-            raise ValidationError("public_token is required and cannot be empty")
-
-        self.public_token = public_token
-        self.private_token = private_token
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.max_retries = max_retries
-        self.verify_ssl = verify_ssl
-
-        self._sync_client: httpx.Client | None = None
-        self._auth_tokens: dict[str, str] = {}
+    __slots__ = ()
 
     def _create_client(self) -> httpx.Client:
-        return httpx.Client(
-            base_url=self.base_url,
-            headers=DEFAULT_HEADERS,
-            timeout=self.timeout,
-            verify=self.verify_ssl,
-        )
+        return httpx.Client(**self._client_options())
 
-    def __enter__(self) -> Self:
+    def __enter__(self) -> "Self":
         """Enter context manager."""
-        self._sync_client = self._create_client()
+        if self._http_client is None:
+            self._http_client = self._create_client()
         return self
 
     def __exit__(self, *args: Any) -> None:
         """Exit context manager."""
-        if self._sync_client:
-            self._sync_client.close()
-            self._sync_client = None
+        self.close()
 
     @property
     def sync_client(self) -> httpx.Client:
         """Lazily initialize and return the HTTP client."""
-        if self._sync_client is None:
-            self._sync_client = self._create_client()
-        return self._sync_client
-
-    def _prepare_headers(self, auth_token: str | None = None) -> dict[str, str]:
-        headers = DEFAULT_HEADERS.copy()
-        if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
-        return headers
-
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        try:
-            data: dict[str, Any] = response.json()
-        except json.JSONDecodeError as e:
-            raise NetworkError(
-                f"Invalid JSON response: {e}",
-                status_code=response.status_code,
-            ) from e
-
-        if response.status_code >= 400 or data.get("status") == "error":
-            raise create_exception_from_response(data, response.status_code)
-
-        return data
+        if self._http_client is None:
+            self._http_client = self._create_client()
+        return self._http_client
 
     def _make_request(
         self,
         method: str,
-        endpoint: str,
-        json_data: dict[str, Any] | None = None,
-        headers: dict[str, str] | None = None,
-        retries: int = 0,
+        endpoint: str | httpx.URL,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
+        idempotent: bool = False,
     ) -> dict[str, Any]:
-        headers = headers or self._prepare_headers()
-
-        try:
-            response = self.sync_client.request(
-                method=method,
-                url=endpoint,
-                json=json_data,
-                headers=headers,
-            )
-            return self._handle_response(response)
-
-        except (httpx.TimeoutException, httpx.NetworkError) as e:
-            if retries < self.max_retries:
-                backoff = 2**retries
-                time.sleep(backoff)
-                return self._make_request(method, endpoint, json_data, headers, retries + 1)
+        # URL and header merging happen once here; retries resend the same request.
+        request = self.sync_client.build_request(
+            method=method,
+            url=endpoint,
+            content=content,
+            headers=headers if headers is not None else self._prepare_headers(),
+        )
 
-            error_class = TimeoutError if isinstance(e, httpx.TimeoutException) else NetworkError
-            raise error_class(f"{type(e).__name__}: {e}") from e
+        attempt = 0
+        while True:
+            try:
+                response = self.sync_client.send(request)
+            except (httpx.TimeoutException, httpx.NetworkError) as e:
+                if attempt >= self.max_retries or not self._can_retry(e, idempotent):
+                    raise self._transport_error(e) from e
+
+                time.sleep(self._retry_delay(attempt))
+                attempt += 1
+                continue
+            except httpx.HTTPError as e:
+                raise NetworkError(f"HTTP error: {e}") from e
+
+            if attempt < self.max_retries and self._can_retry_status(
+                response.status_code, idempotent
+            ):
+                time.sleep(self._retry_delay(attempt, response))
+                attempt += 1
+                continue
 
-        except httpx.HTTPError as e:
-            raise NetworkError(f"HTTP error: {e}") from e
+            return self._handle_response(response)
 
     def create_payment(
         self,
@@ -202,15 +149,31 @@ class ATHMovilClient:
 
         response = self._make_request(
             "POST",
-            ENDPOINTS["payment"],
-            json_data=request_data.model_dump(by_alias=True, exclude_none=True),
+            self._endpoint_urls["payment"],
+            content=request_data.model_dump_json(by_alias=True, exclude_none=True).encode(),
         )
 
         payment_response = PaymentResponse(**response)
-        self._auth_tokens[payment_response.data.ecommerce_id] = payment_response.data.auth_token
+        self._store_auth_token(payment_response.data.ecommerce_id, payment_response.data.auth_token)
 
         return payment_response
 
+    def _find_payment_data(self, ecommerce_id: str) -> dict[str, Any]:
+        try:
+            request_data = FindPaymentRequest(
+                ecommerce_id=ecommerce_id,
+                public_token=self.public_token,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="payment lookup") from e
+
+        return self._make_request(
+            "POST",
+            self._endpoint_urls["find_payment"],
+            content=request_data.model_dump_json(by_alias=True).encode(),
+            idempotent=True,
+        )
+
     def find_payment(self, ecommerce_id: str) -> TransactionResponse:
         """Check payment status.
 
@@ -223,16 +186,7 @@ class ATHMovilClient:
         Raises:
             ATHMovilError: On API errors
         """
-        request_data = FindPaymentRequest(
-            ecommerce_id=ecommerce_id,
-            public_token=self.public_token,
-        )
-
-        response = self._make_request(
-            "POST",
-            ENDPOINTS["find_payment"],
-            json_data=request_data.model_dump(by_alias=True),
-        )
+        response = self._find_payment_data(ecommerce_id)
 
         return TransactionResponse(**response)
 
@@ -254,7 +208,7 @@ class ATHMovilClient:
             AuthenticationError: If no auth token available
             ATHMovilError: On API errors
         """
-        token = auth_token or self._auth_tokens.get(ecommerce_id)
+        token = auth_token or self._stored_auth_token(ecommerce_id)
         if not token:
             raise AuthenticationError(
                 "No auth token available. Create payment first or provide auth_token."
@@ -264,8 +218,8 @@ class ATHMovilClient:
 
         response = self._make_request(
             "POST",
-            ENDPOINTS["authorization"],
-            json_data={},
+            self._endpoint_urls["authorization"],
+            content=_EMPTY_JSON,
             headers=headers,
         )
 
@@ -292,7 +246,7 @@ class ATHMovilClient:
             ValidationError: On invalid phone number
             ATHMovilError: On API errors
         """
-        token = auth_token or self._auth_tokens.get(ecommerce_id)
+        token = auth_token or self._stored_auth_token(ecommerce_id)
         if not token:
             raise AuthenticationError("No auth token available")
 
@@ -308,9 +262,10 @@ class ATHMovilClient:
 
         response = self._make_request(
             "PUT",
-            ENDPOINTS["update_phone"],
-            json_data=request_data.model_dump(by_alias=True),
+            self._endpoint_urls["update_phone"],
+            content=request_data.model_dump_json(by_alias=True).encode(),
             headers=headers,
+            idempotent=True,
         )
 
         return SuccessResponse(**response)
@@ -327,15 +282,19 @@ class ATHMovilClient:
         Raises:
             ATHMovilError: On API errors
         """
-        request_data = CancelPaymentRequest(
-            ecommerce_id=ecommerce_id,
-            public_token=self.public_token,
-        )
+        try:
+            request_data = CancelPaymentRequest(
+                ecommerce_id=ecommerce_id,
+                public_token=self.public_token,
+            )
+        except PydanticValidationError as e:
+            raise ValidationError.from_pydantic(e, context="cancel request") from e
 
         response = self._make_request(
             "POST",
-            ENDPOINTS["cancel"],
-            json_data=request_data.model_dump(by_alias=True),
+            self._endpoint_urls["cancel"],
+            content=request_data.model_dump_json(by_alias=True).encode(),
+            idempotent=True,
         )
 
         self._auth_tokens.pop(ecommerce_id, None)
@@ -379,8 +338,8 @@ class ATHMovilClient:
 
         response = self._make_request(
             "POST",
-            ENDPOINTS["refund"],
-            json_data=request_data.model_dump(by_alias=True, exclude_none=True),
+            self._endpoint_urls["refund"],
+            content=request_data.model_dump_json(by_alias=True, exclude_none=True).encode(),
         )
 
         return RefundResponse(**response)
@@ -393,12 +352,14 @@ class ATHMovilClient:
     ) -> bool:
         """Wait for customer to confirm payment.
 
-        Polls payment status until customer confirms or timeout is reached.
+        Polls payment status until customer confirms or timeout is reached. The
+        wait between polls starts at polling_interval and doubles after each
+        check, up to 15 seconds.
 
         Args:
             ecommerce_id: The payment ID from create_payment()
             timeout: Maximum seconds to wait (default: 300)
-            polling_interval: Seconds between status checks (default: 2.0)
+            polling_interval: Initial seconds between status checks (default: 2.0)
 
         Returns:
             True if payment was confirmed
@@ -412,20 +373,28 @@ class ATHMovilClient:
             >>> client.wait_for_confirmation(payment.data.ecommerce_id)
             >>> result = client.authorize_payment(payment.data.ecommerce_id)
         """
-        elapsed = 0.0
-        while elapsed < timeout:
-            status = self.find_payment(ecommerce_id)
-
-            if status.data and status.data.ecommerce_status == TransactionStatus.CONFIRM:
+        deadline = time.monotonic() + timeout
+        interval = polling_interval
+        remaining = float(timeout)
+        # A non-positive timeout gives up without polling
+        while remaining > 0:
+            # Only the status is needed here, so skip building a TransactionResponse
+            status = self._ecommerce_status(self._find_payment_data(ecommerce_id))
+
+            if status == TransactionStatus.CONFIRM:
                 return True
-            elif status.data and status.data.ecommerce_status == TransactionStatus.CANCEL:
+            elif status == TransactionStatus.CANCEL:
                 raise TransactionError(
                     "Payment was cancelled",
                     error_code="PAYMENT_CANCELLED",
                 )
 
-            time.sleep(polling_interval)
-            elapsed += polling_interval
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            time.sleep(self._polling_delay(interval, remaining))
+            interval = self._next_polling_interval(interval)
 
         raise TimeoutError(
             f"Payment not confirmed within {timeout} seconds",
@@ -433,10 +402,13 @@ class ATHMovilClient:
         )
 
     def close(self) -> None:
-        """Close HTTP client and cleanup resources."""
-        if self._sync_client:
-            self._sync_client.close()
-            self._sync_client = None
+        """Close HTTP client and cleanup resources.
+
+        A client passed in as http_client is left open for its owner to close.
+        """
+        if self._http_client and self._owns_http_client:
+            self._http_client.close()
+            self._http_client = None
 
     def subscribe_webhook(
         self,
@@ -511,7 +483,7 @@ class ATHMovilClient:
         try:
             response = httpx.post(
                 url,
-                json=request.model_dump(by_alias=True),
+                content=request.model_dump_json(by_alias=True).encode(),
                 headers=DEFAULT_HEADERS,
                 timeout=self.timeout,
             )
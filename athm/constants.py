@@ -1,6 +1,7 @@
 """Constants and error codes for ATH Móvil API."""
 
 from enum import Enum
+from types import MappingProxyType
 
 
 class ErrorCode(str, Enum):
@@ -58,14 +59,31 @@ MAX_MESSAGE_LENGTH = 50
 # HTTP client configuration
 REQUEST_TIMEOUT = 30
 MAX_RETRIES = 3
+RETRY_BASE = 0.1
+RETRY_CAP = 30.0
+# Responses after which an idempotent request may be sent again
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 503})
+# Rate-limited requests are rejected before processing, so any request may be resent
+UNPROCESSED_STATUS_CODES: frozenset[int] = frozenset({429})
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 30.0
+MAX_STORED_AUTH_TOKENS = 10_000
 
-DEFAULT_HEADERS = {
-    "Accept": "application/json",
-    "Content-Type": "application/json",
-}
+# Payment confirmation polling
+MAX_POLLING_INTERVAL = 15.0
+POLLING_JITTER = 0.1  # Fraction of the interval added at random to each wait
+
+# Read-only so the module-level mapping shared by every client can't be mutated
+DEFAULT_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+)
 
 # Error code categories for exception mapping
-AUTH_ERROR_CODES = frozenset(
+AUTH_ERROR_CODES: frozenset[str] = frozenset(
     {
         ErrorCode.TOKEN_INVALID_HEADER.value,
         ErrorCode.TOKEN_EXPIRED.value,
@@ -76,7 +94,7 @@ AUTH_ERROR_CODES = frozenset(
     }
 )
 
-VALIDATION_ERROR_CODES = frozenset(
+VALIDATION_ERROR_CODES: frozenset[str] = frozenset(
     {
         ErrorCode.BTRA_0001.value,
         ErrorCode.BTRA_0004.value,
@@ -90,7 +108,7 @@ VALIDATION_ERROR_CODES = frozenset(
     }
 )
 
-TRANSACTION_ERROR_CODES = frozenset(
+TRANSACTION_ERROR_CODES: frozenset[str] = frozenset(
     {
         ErrorCode.BTRA_0007.value,
         ErrorCode.BTRA_0031.value,
@@ -1,8 +1,9 @@
 """Custom exceptions for ATH Móvil API errors."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from pydantic import ValidationError as PydanticValidationError
@@ -15,7 +16,7 @@ from athm.constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FieldError:
     """Single field validation error."""
 
@@ -27,6 +28,9 @@ class FieldError:
 class ATHMovilError(Exception):
     """Base exception for all ATH Móvil API errors."""
 
+    # Exceptions still get an instance __dict__, but it is only allocated if used
+    __slots__ = ("error_code", "message", "response_data", "status_code")
+
     def __init__(
         self,
         message: str,
@@ -48,16 +52,45 @@ class ATHMovilError(Exception):
         self.status_code = status_code
         self.response_data = response_data
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Include slot attributes, which BaseException doesn't pickle."""
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+        }
+        return type(self), (self.message,), {**self.__dict__, **state}
+
+
+_ErrorT = TypeVar("_ErrorT", bound=type[ATHMovilError])
+
+# Exception class for every known API error code, filled in by _register_error_codes
+_ERROR_CODE_EXCEPTIONS: dict[str, type[ATHMovilError]] = {}
+
 
+def _register_error_codes(*codes: str) -> Callable[[_ErrorT], _ErrorT]:
+    """Map API error codes to the decorated exception class."""
+
+    def register(cls: _ErrorT) -> _ErrorT:
+        _ERROR_CODE_EXCEPTIONS.update(dict.fromkeys(codes, cls))
+        return cls
+
+    return register
+
+
+@_register_error_codes(*AUTH_ERROR_CODES)
 class AuthenticationError(ATHMovilError):
     """Raised when authentication with ATH Móvil API fails."""
 
-    pass
+    __slots__ = ()
 
 
+@_register_error_codes(*VALIDATION_ERROR_CODES)
 class ValidationError(ATHMovilError):
     """Raised when request validation fails."""
 
+    __slots__ = ("errors",)
+
     def __init__(
         self,
         message: str,
@@ -94,7 +127,7 @@ class ValidationError(ATHMovilError):
         field_errors: list[FieldError] = []
         for error in exc.errors():
             loc = error.get("loc", ())
-            field_name = ".".join(str(x) for x in loc) if loc else "unknown"
+            field_name = ".".join(map(str, loc)) if loc else "unknown"
             msg_value = error.get("msg", "Invalid value")
             msg = str(msg_value) if msg_value else "Invalid value"
             # Clean up Pydantic message artifacts
@@ -116,34 +149,54 @@ class ValidationError(ATHMovilError):
         return cls(message=summary, errors=field_errors)
 
 
+@_register_error_codes(*TRANSACTION_ERROR_CODES)
 class TransactionError(ATHMovilError):
     """Raised when a transaction operation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class TimeoutError(ATHMovilError):
     """Raised when an API request times out."""
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(ATHMovilError):
     """Raised when API rate limit is exceeded."""
 
-    pass
+    __slots__ = ()
 
 
+@_register_error_codes(ErrorCode.BTRA_9998.value)
 class NetworkError(ATHMovilError):
     """Raised when a network-related error occurs during API communication."""
 
-    pass
+    __slots__ = ()
 
 
+@_register_error_codes(ErrorCode.BTRA_9999.value)
 class InternalServerError(ATHMovilError):
     """Raised when ATH Móvil API experiences an internal server error."""
 
-    pass
+    __slots__ = ()
+
+
+# Fallback for responses without a known error code
+_STATUS_CODE_EXCEPTIONS: dict[int, type[ATHMovilError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    429: RateLimitError,
+}
+
+
+def _resolve_exception_class(error_code: str | None, status_code: int) -> type[ATHMovilError]:
+    error_class = _ERROR_CODE_EXCEPTIONS.get(error_code) if error_code else None
+    if error_class is None:
+        error_class = _STATUS_CODE_EXCEPTIONS.get(status_code)
+    if error_class is None:
+        error_class = InternalServerError if status_code >= 500 else ATHMovilError
+    return error_class
 
 
 def create_exception_from_response(
@@ -155,73 +208,8 @@ def create_exception_from_response(
     error_code_value = response_data.get("errorcode")
     error_code: str | None = error_code_value if isinstance(error_code_value, str) else None
 
-    if error_code:
-        if error_code in AUTH_ERROR_CODES:
-            return AuthenticationError(
-                message=message,
-                error_code=error_code,
-                status_code=status_code,
-                response_data=response_data,
-            )
-        if error_code in VALIDATION_ERROR_CODES:
-            return ValidationError(
-                message=message,
-                error_code=error_code,
-                status_code=status_code,
-                response_data=response_data,
-            )
-        if error_code in TRANSACTION_ERROR_CODES:
-            return TransactionError(
-                message=message,
-                error_code=error_code,
-                status_code=status_code,
-                response_data=response_data,
-            )
-        if error_code == ErrorCode.BTRA_9998.value:
-            return NetworkError(
-                message=message,
-                error_code=error_code,
-                status_code=status_code,
-                response_data=response_data,
-            )
-        if error_code == ErrorCode.BTRA_9999.value:
-            return InternalServerError(
-                message=message,
-                error_code=error_code,
-                status_code=status_code,
-                response_data=response_data,
-            )
-
-    if status_code == 401:
-        return AuthenticationError(
-            message=message,
-            error_code=error_code,
-            status_code=status_code,
-            response_data=response_data,
-        )
-    if status_code == 400:
-        return ValidationError(
-            message=message,
-            error_code=error_code,
-            status_code=status_code,
-            response_data=response_data,
-        )
-    if status_code == 429:
-        return RateLimitError(
-            message=message,
-            error_code=error_code,
-            status_code=status_code,
-            response_data=response_data,
-        )
-    if status_code >= 500:
-        return InternalServerError(
-            message=message,
-            error_code=error_code,
-            status_code=status_code,
-            response_data=response_data,
-        )
-
-    return ATHMovilError(
+    error_class = _resolve_exception_class(error_code, status_code)
+    return error_class(
         message=message,
         error_code=error_code,
         status_code=status_code,
@@ -1,6 +1,6 @@
 """Pydantic models for ATH Movil API."""
 
-from athm.models.base import ATHMovilBaseModel
+from athm.models.base import ATHMovilBaseModel, ATHMovilResponseModel
 from athm.models.payment import (
     APIError,
     CancelPaymentRequest,
@@ -31,6 +31,7 @@ from athm.models.webhooks import (
 __all__ = [
     "APIError",
     "ATHMovilBaseModel",
+    "ATHMovilResponseModel",
     "CancelPaymentRequest",
     "FindPaymentRequest",
     "OriginalTransaction",
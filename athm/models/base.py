@@ -6,4 +6,12 @@ from pydantic import BaseModel, ConfigDict
 class ATHMovilBaseModel(BaseModel):
     """Base model with common configuration for ATH Movil API models."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    # Numbers are coerced to str in pydantic-core, so fields the API sends as either
+    # (phone numbers, IDs) don't need a Python validator just to call str()
+    model_config = ConfigDict(populate_by_name=True, coerce_numbers_to_str=True)
+
+
+class ATHMovilResponseModel(ATHMovilBaseModel):
+    """Base model for read-only data returned by the ATH Movil API."""
+
+    model_config = ConfigDict(frozen=True)
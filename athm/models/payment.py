@@ -1,32 +1,65 @@
 """Pydantic models for ATH Movil payment API data structures."""
 
+import re
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from enum import Enum
-from typing import Annotated, Any
+from typing import Any
 
-from pydantic import BeforeValidator, Field, field_validator, model_validator
+from pydantic import Field, field_validator, model_validator
 
-from athm.models.base import ATHMovilBaseModel
+from athm.models.base import ATHMovilBaseModel, ATHMovilResponseModel
 
 # Shared constants
 PHONE_NUMBER_PATTERN = r"^\d{10}$"
 
+_CENT = Decimal("0.01")
+_MIN_TOTAL_CENTS = 100
+_MAX_TOTAL_CENTS = 150_000
+# Unsigned amounts with at most two decimals, which can be padded to two
+# decimals with string operations instead of a Decimal round-trip.
+_SHORT_AMOUNT_RE = re.compile(r"(\d+)(?:\.(\d{1,2}))?", re.ASCII)
+# The API's zero-padded "YYYY-MM-DD HH:MM:SS"; other ISO forms must not reach fromisoformat
+_TRANSACTION_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", re.ASCII)
 
-def _to_str(v: str | int | None) -> str | None:
-    """Convert value to string if not None."""
-    return str(v) if v is not None else None
+
+def _to_cents(amount: str) -> int:
+    """Convert an amount already formatted by _validate_decimal to integer cents."""
+    return int(amount.replace(".", "", 1))
+
+
+def _format_cents(cents: int) -> str:
+    """Format integer cents as a two-decimal amount."""
+    return f"{cents // 100}.{cents % 100:02d}"
+
+
+def _check_bounds(cents: int | Decimal, min_cents: int | None, max_cents: int | None) -> None:
+    if min_cents is not None and cents < min_cents:
+        raise ValueError(f"Total must be at least ${_format_cents(min_cents)}")
+    if max_cents is not None and cents > max_cents:
+        raise ValueError(f"Total cannot exceed ${_format_cents(max_cents)}")
 
 
 def _validate_decimal(
     v: str | int | float,
     *,
-    min_value: Decimal | None = None,
-    max_value: Decimal | None = None,
+    min_cents: int | None = None,
+    max_cents: int | None = None,
     positive_only: bool = False,
     non_negative: bool = False,
 ) -> str:
     """Validate and format decimal amount to 2 decimal places."""
+    if isinstance(v, str):
+        match = _SHORT_AMOUNT_RE.fullmatch(v)
+        if match:
+            whole, frac = match.groups()
+            amount = f"{int(whole)}.{(frac or '').ljust(2, '0')}"
+            cents = _to_cents(amount)
+            # The pattern only matches unsigned amounts, so only zero can fail the sign checks
+            if positive_only and cents == 0:
+                raise ValueError("Amount must be positive")
+            _check_bounds(cents, min_cents, max_cents)
+            return amount
     try:
         decimal_val = Decimal(str(v))
     except InvalidOperation as e:
@@ -35,15 +68,9 @@ def _validate_decimal(
         raise ValueError("Amount must be positive")
     if non_negative and decimal_val < 0:
         raise ValueError("Amount cannot be negative")
-    if min_value is not None and decimal_val < min_value:
-        raise ValueError(f"Total must be at least ${min_value}")
-    if max_value is not None and decimal_val > max_value:
-        raise ValueError(f"Total cannot exceed ${max_value}")
-    return str(decimal_val.quantize(Decimal("0.01")))
-
-
-# Reusable type for daily transaction ID (handles int-to-str conversion)
-DailyTransactionId = Annotated[str | None, BeforeValidator(_to_str)]
+    # Bounds are checked before rounding, so 0.999 is still below $1.00
+    _check_bounds(decimal_val.scaleb(2), min_cents, max_cents)
+    return str(decimal_val.quantize(_CENT))
 
 
 class TransactionStatus(str, Enum):
@@ -102,7 +129,7 @@ class PaymentRequest(ATHMovilBaseModel):
     @classmethod
     def validate_total(cls, v: str) -> str:
         """Validate total amount."""
-        return _validate_decimal(v, min_value=Decimal("1.00"), max_value=Decimal("1500.00"))
+        return _validate_decimal(v, min_cents=_MIN_TOTAL_CENTS, max_cents=_MAX_TOTAL_CENTS)
 
     @field_validator("tax", "subtotal")
     @classmethod
@@ -110,7 +137,7 @@ class PaymentRequest(ATHMovilBaseModel):
         """Validate tax and subtotal amounts."""
         if v is None:
             return None
-        return _validate_decimal(v, non_negative=True, max_value=Decimal("1500.00"))
+        return _validate_decimal(v, non_negative=True, max_cents=_MAX_TOTAL_CENTS)
 
     @field_validator("timeout")
     @classmethod
@@ -124,26 +151,27 @@ class PaymentRequest(ATHMovilBaseModel):
     @model_validator(mode="after")
     def validate_totals(self) -> "PaymentRequest":
         """Validate that total equals subtotal plus tax when both are provided."""
-        if self.subtotal and self.tax:
-            subtotal_val = Decimal(self.subtotal)
-            tax_val = Decimal(self.tax)
-            total_val = Decimal(self.total)
-            calculated_total = subtotal_val + tax_val
-            if calculated_total != total_val:
-                raise ValueError(
-                    f"Total ({total_val}) must equal subtotal ({subtotal_val}) + tax ({tax_val})"
-                )
+        # Validated amounts always have exactly two decimals, so the check can
+        # compare integer cents instead of parsing them back into Decimals
+        if (
+            self.subtotal
+            and self.tax
+            and _to_cents(self.subtotal) + _to_cents(self.tax) != _to_cents(self.total)
+        ):
+            raise ValueError(
+                f"Total ({self.total}) must equal subtotal ({self.subtotal}) + tax ({self.tax})"
+            )
         return self
 
 
-class PaymentData(ATHMovilBaseModel):
+class PaymentData(ATHMovilResponseModel):
     """Data returned from payment creation."""
 
     ecommerce_id: str = Field(..., alias="ecommerceId")
     auth_token: str
 
 
-class PaymentResponse(ATHMovilBaseModel):
+class PaymentResponse(ATHMovilResponseModel):
     """Response from payment creation."""
 
     status: str
@@ -157,7 +185,7 @@ class FindPaymentRequest(ATHMovilBaseModel):
     public_token: str = Field(..., alias="publicToken")
 
 
-class TransactionData(ATHMovilBaseModel):
+class TransactionData(ATHMovilResponseModel):
     """Detailed transaction information."""
 
     ecommerce_status: TransactionStatus = Field(..., alias="ecommerceStatus")
@@ -165,7 +193,7 @@ class TransactionData(ATHMovilBaseModel):
     reference_number: str | None = Field(None, alias="referenceNumber")
     business_customer_id: str | None = Field(None, alias="businessCustomerId")
     transaction_date: datetime | None = Field(None, alias="transactionDate")
-    daily_transaction_id: DailyTransactionId = Field(None, alias="dailyTransactionId")
+    daily_transaction_id: str | None = Field(None, alias="dailyTransactionId")
     business_name: str | None = Field(None, alias="businessName")
     business_path: str | None = Field(None, alias="businessPath")
     industry: str | None = None
@@ -188,10 +216,14 @@ class TransactionData(ATHMovilBaseModel):
             return None
         if isinstance(v, datetime):
             return v
+        # fromisoformat is implemented in C; strptime still handles values without
+        # zero padding and rejects anything else
+        if _TRANSACTION_DATE_RE.fullmatch(v):
+            return datetime.fromisoformat(v)
         return datetime.strptime(v, "%Y-%m-%d %H:%M:%S")
 
 
-class TransactionResponse(ATHMovilBaseModel):
+class TransactionResponse(ATHMovilResponseModel):
     """Response from transaction status check."""
 
     status: str
@@ -228,7 +260,7 @@ class RefundRequest(ATHMovilBaseModel):
         return _validate_decimal(v, positive_only=True)
 
 
-class RefundTransaction(ATHMovilBaseModel):
+class RefundTransaction(ATHMovilResponseModel):
     """Refund transaction details."""
 
     transaction_type: str | None = Field(None, alias="transactionType")
@@ -236,20 +268,20 @@ class RefundTransaction(ATHMovilBaseModel):
     refunded_amount: Decimal | None = Field(None, alias="refundedAmount")
     date: str | None = None  # Timestamp string
     reference_number: str | None = Field(None, alias="referenceNumber")
-    daily_transaction_id: DailyTransactionId = Field(None, alias="dailyTransactionId")
+    daily_transaction_id: str | None = Field(None, alias="dailyTransactionId")
     name: str | None = None
     phone_number: str | None = Field(None, alias="phoneNumber")
     email: str | None = None
 
 
-class OriginalTransaction(ATHMovilBaseModel):
+class OriginalTransaction(ATHMovilResponseModel):
     """Original transaction details in refund response."""
 
     transaction_type: str | None = Field(None, alias="transactionType")
     status: str | None = None
     date: str | None = None  # Timestamp string
     reference_number: str | None = Field(None, alias="referenceNumber")
-    daily_transaction_id: DailyTransactionId = Field(None, alias="dailyTransactionId")
+    daily_transaction_id: str | None = Field(None, alias="dailyTransactionId")
     name: str | None = None
     phone_number: str | None = Field(None, alias="phoneNumber")
     email: str | None = None
@@ -265,21 +297,21 @@ class OriginalTransaction(ATHMovilBaseModel):
     items: list[PaymentItem] | None = None
 
 
-class RefundData(ATHMovilBaseModel):
+class RefundData(ATHMovilResponseModel):
     """Data returned from refund request."""
 
     refund: RefundTransaction
     original_transaction: OriginalTransaction = Field(..., alias="originalTransaction")
 
 
-class RefundResponse(ATHMovilBaseModel):
+class RefundResponse(ATHMovilResponseModel):
     """Response from refund request."""
 
     status: str
     data: RefundData
 
 
-class APIError(ATHMovilBaseModel):
+class APIError(ATHMovilResponseModel):
     """API error response."""
 
     status: str
@@ -288,7 +320,7 @@ class APIError(ATHMovilBaseModel):
     data: Any | None = None
 
 
-class SuccessResponse(ATHMovilBaseModel):
+class SuccessResponse(ATHMovilResponseModel):
     """Generic success response."""
 
     status: str
@@ -3,16 +3,31 @@
 Ref: https://github.com/evertec/athmovil-webhooks
 """
 
+import re
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import Annotated
 
-from pydantic import Field, field_validator, model_validator
+from pydantic import AliasChoices, BeforeValidator, Field, field_validator
 
 from athm.models.base import ATHMovilBaseModel
 
 
+def _empty_to_none(v: object) -> object:
+    """Treat empty strings as missing values."""
+    # Comparing a Decimal to "" goes through both __eq__ methods, so check the type first
+    return None if isinstance(v, str) and not v else v
+
+
+# Optional amount; pydantic converts strings and numbers to Decimal
+OptionalDecimal = Annotated[Decimal | None, BeforeValidator(_empty_to_none)]
+
+# Exact shape of the datetimes ATH Movil sends, after fractions are padded to 6 digits;
+# fromisoformat alone would also accept offsets and ISO week dates
+_WEBHOOK_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:\.\d{6})?", re.ASCII)
+
+
 class WebhookEventType(str, Enum):
     """Webhook event types from ATH Movil.
 
@@ -44,6 +59,24 @@ class WebhookStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Spellings the API is known to send, mapped straight to enum members so the
+# common case is one dict lookup and pydantic's enum check is an isinstance test
+_TRANSACTION_TYPES: dict[str, WebhookEventType] = {
+    spelling: event_type
+    for event_type in WebhookEventType
+    for spelling in (event_type.value, event_type.value.upper())
+}
+_STATUSES: dict[str, WebhookStatus] = {
+    **{
+        spelling: status
+        for status in WebhookStatus
+        for spelling in (status.value, status.value.upper())
+    },
+    "cancel": WebhookStatus.CANCELLED,
+    "CANCEL": WebhookStatus.CANCELLED,
+}
+
+
 class WebhookItem(ATHMovilBaseModel):
     """Item in webhook payload.
 
@@ -54,28 +87,11 @@ class WebhookItem(ATHMovilBaseModel):
     description: str
     price: Decimal
     quantity: int
-    tax: Decimal | None = None
+    tax: OptionalDecimal = None
     metadata: str | None = None
     sku: str | None = None
     formatted_price: str | None = Field(None, alias="formattedPrice")
 
-    @field_validator("price", "tax", mode="before")
-    @classmethod
-    def normalize_decimal(cls, v: str | int | float | None) -> Decimal | None:
-        """Convert string or number amounts to Decimal."""
-        if v is None or v == "":
-            return None
-        try:
-            return Decimal(str(v))
-        except InvalidOperation as e:
-            raise ValueError(f"Invalid decimal value: {v}") from e
-
-    @field_validator("quantity", mode="before")
-    @classmethod
-    def normalize_quantity(cls, v: str | int) -> int:
-        """Convert quantity to int."""
-        return int(v)
-
 
 class WebhookPayload(ATHMovilBaseModel):
     """Parsed and normalized webhook payload from ATH Movil.
@@ -93,11 +109,19 @@ class WebhookPayload(ATHMovilBaseModel):
     transaction_type: WebhookEventType = Field(..., alias="transactionType")
     status: WebhookStatus
     reference_number: str | None = Field(None, alias="referenceNumber")
-    daily_transaction_id: str | None = None
+    # dailyTransactionID (standard events) vs dailyTransactionId (eCommerce)
+    daily_transaction_id: str | None = Field(
+        None,
+        validation_alias=AliasChoices(
+            "dailyTransactionID", "dailyTransactionId", "daily_transaction_id"
+        ),
+    )
 
     # Timestamps
     date: datetime
-    transaction_date: datetime | None = None  # eCommerce only
+    transaction_date: datetime | None = Field(  # eCommerce only
+        None, validation_alias=AliasChoices("transactionDate", "transaction_date")
+    )
 
     # Customer info
     name: str | None = None
@@ -105,13 +129,17 @@ class WebhookPayload(ATHMovilBaseModel):
     email: str | None = None
     message: str | None = None
 
-    # Amounts (normalized to Decimal)
+    # Amounts (normalized to Decimal). Standard events send amounts as strings
+    # ("3.00"), eCommerce events as numbers (3.00).
     total: Decimal
-    tax: Decimal | None = None
-    subtotal: Decimal | None = None
-    fee: Decimal | None = None
-    net_amount: Decimal | None = Field(None, alias="netAmount")
-    total_refunded_amount: Decimal | None = None
+    tax: OptionalDecimal = None
+    # subtotal (standard events) vs subTotal (eCommerce)
+    subtotal: OptionalDecimal = Field(None, validation_alias=AliasChoices("subtotal", "subTotal"))
+    fee: OptionalDecimal = None
+    net_amount: OptionalDecimal = Field(None, alias="netAmount")
+    total_refunded_amount: OptionalDecimal = Field(
+        None, validation_alias=AliasChoices("totalRefundedAmount", "total_refunded_amount")
+    )
 
     # Metadata
     metadata1: str | None = None
@@ -124,41 +152,9 @@ class WebhookPayload(ATHMovilBaseModel):
     is_non_profit: bool | None = Field(None, alias="isNonProfit")
     reference_transaction_id: str | None = Field(None, alias="referenceTransactionId")
 
-    @model_validator(mode="before")
-    @classmethod
-    def normalize_field_names(cls, data: dict[str, Any]) -> dict[str, Any]:
-        """Handle API field name inconsistencies.
-
-        The ATH Movil webhook API has inconsistent field naming:
-        - dailyTransactionID (standard events) vs dailyTransactionId (eCommerce)
-        - subTotal (eCommerce) vs subtotal (standard events)
-        - totalRefundedAmount needs snake_case conversion
-
-        Ref: https://github.com/evertec/athmovil-webhooks#webhook-payload-structure
-        """
-        # dailyTransactionID or dailyTransactionId -> daily_transaction_id
-        if "dailyTransactionID" in data:
-            data["daily_transaction_id"] = data.pop("dailyTransactionID")
-        elif "dailyTransactionId" in data:
-            data["daily_transaction_id"] = data.pop("dailyTransactionId")
-
-        # subTotal -> subtotal (eCommerce events use subTotal)
-        if "subTotal" in data and "subtotal" not in data:
-            data["subtotal"] = data.pop("subTotal")
-
-        # totalRefundedAmount -> total_refunded_amount
-        if "totalRefundedAmount" in data:
-            data["total_refunded_amount"] = data.pop("totalRefundedAmount")
-
-        # transactionDate -> transaction_date (eCommerce only)
-        if "transactionDate" in data:
-            data["transaction_date"] = data.pop("transactionDate")
-
-        return data
-
     @field_validator("transaction_type", mode="before")
     @classmethod
-    def normalize_transaction_type(cls, v: object) -> str:
+    def normalize_transaction_type(cls, v: object) -> WebhookEventType | str:
         """Normalize transaction type to lowercase.
 
         The API returns "ECOMMERCE" for completed/cancelled events
@@ -166,13 +162,14 @@ class WebhookPayload(ATHMovilBaseModel):
 
         Ref: https://github.com/evertec/athmovil-webhooks#event-types
         """
-        if isinstance(v, str):
-            return v.lower()
+        known = _TRANSACTION_TYPES.get(v) if isinstance(v, str) else None
+        if known is not None:
+            return known
         return str(v).lower()
 
     @field_validator("status", mode="before")
     @classmethod
-    def normalize_status(cls, v: object) -> str:
+    def normalize_status(cls, v: object) -> WebhookStatus | str:
         """Normalize status values.
 
         The API returns:
@@ -185,30 +182,14 @@ class WebhookPayload(ATHMovilBaseModel):
 
         Ref: https://github.com/evertec/athmovil-webhooks#event-types
         """
+        known = _STATUSES.get(v) if isinstance(v, str) else None
+        if known is not None:
+            return known
         status = str(v).lower() if v else ""
         if status == "cancel":
             return "cancelled"
         return status
 
-    @field_validator(
-        "total", "tax", "subtotal", "fee", "net_amount", "total_refunded_amount", mode="before"
-    )
-    @classmethod
-    def normalize_decimal(cls, v: str | int | float | None) -> Decimal | None:
-        """Convert string or number amounts to Decimal.
-
-        Standard events send amounts as strings ("3.00").
-        eCommerce events send amounts as numbers (3.00).
-
-        Ref: https://github.com/evertec/athmovil-webhooks#webhook-payload-structure
-        """
-        if v is None or v == "":
-            return None
-        try:
-            return Decimal(str(v))
-        except InvalidOperation as e:
-            raise ValueError(f"Invalid decimal value: {v}") from e
-
     @field_validator("date", "transaction_date", mode="before")
     @classmethod
     def parse_datetime(cls, v: str | datetime | None) -> datetime | None:
@@ -217,13 +198,22 @@ class WebhookPayload(ATHMovilBaseModel):
             return None
         if isinstance(v, datetime):
             return v
+        if not isinstance(v, str):
+            raise ValueError(f"Unable to parse datetime: {v!r}")
 
         # Normalize fractional seconds to 6 digits for %f compatibility
         # ATH Movil sends variable-length fractions like ".0", ".00", etc.
-        if "." in v:
-            base, frac = v.rsplit(".", 1)
-            if frac.isdigit():
-                v = f"{base}.{frac.ljust(6, '0')}"
+        base, sep, frac = v.rpartition(".")
+        if sep and frac.isdigit():
+            v = f"{base}.{frac.ljust(6, '0')}"
+
+        # Zero-padded "YYYY-MM-DD HH:MM:SS[.ffffff]" (space or T separator) is what
+        # ATH Movil sends; fromisoformat parses it in C without trying each format
+        if _WEBHOOK_DATETIME_RE.fullmatch(v):
+            try:
+                return datetime.fromisoformat(v)
+            except ValueError:
+                pass
 
         # Try common formats from ATH Movil webhooks
         for fmt in (
@@ -238,14 +228,6 @@ class WebhookPayload(ATHMovilBaseModel):
                 continue
         raise ValueError(f"Unable to parse datetime: {v}")
 
-    @field_validator("phone_number", mode="before")
-    @classmethod
-    def normalize_phone(cls, v: str | int | None) -> str | None:
-        """Convert phone number to string (API sometimes sends as number)."""
-        if v is None:
-            return None
-        return str(v)
-
 
 class WebhookSubscriptionRequest(ATHMovilBaseModel):
     """Request model for webhook subscription.
@@ -8,6 +8,8 @@ Ref: https://github.com/evertec/athmovil-webhooks
 
 from typing import Any
 
+from pydantic import ValidationError as PydanticValidationError
+
 from athm.exceptions import ValidationError
 from athm.models.webhooks import (
     WebhookEventType,
@@ -27,8 +29,13 @@ __all__ = [
     "parse_webhook",
 ]
 
+# Bound once so parse_webhook calls pydantic-core directly instead of going
+# through the model_validate classmethods on every event
+_validate_python = WebhookPayload.__pydantic_validator__.validate_python
+_validate_json = WebhookPayload.__pydantic_validator__.validate_json
+
 
-def parse_webhook(payload: dict[str, Any]) -> WebhookPayload:
+def parse_webhook(payload: bytes | str | dict[str, Any]) -> WebhookPayload:
     """Parse and validate a webhook payload from ATH Movil.
 
     This function normalizes the various inconsistencies in the ATH Movil
@@ -37,7 +44,8 @@ def parse_webhook(payload: dict[str, Any]) -> WebhookPayload:
     Ref: https://github.com/evertec/athmovil-webhooks
 
     Args:
-        payload: Raw JSON payload from webhook request body
+        payload: Raw webhook request body, or the already decoded JSON object.
+            Passing the raw body is faster since pydantic parses it directly.
 
     Returns:
         Validated and normalized WebhookPayload
@@ -51,14 +59,18 @@ def parse_webhook(payload: dict[str, Any]) -> WebhookPayload:
 
         @app.post("/webhook")
         async def handle_webhook(request: Request):
-            payload = await request.json()
-            event = parse_webhook(payload)
+            event = parse_webhook(await request.body())
 
             if event.transaction_type == WebhookEventType.PAYMENT:
                 process_payment(event)
         ```
     """
+    event: WebhookPayload
     try:
-        return WebhookPayload.model_validate(payload)
-    except Exception as e:
-        raise ValidationError(f"Invalid webhook payload: {e}") from e
+        if isinstance(payload, (bytes, str)):
+            event = _validate_json(payload)
+        else:
+            event = _validate_python(payload)
+    except PydanticValidationError as e:
+        raise ValidationError.from_pydantic(e, context="webhook payload") from e
+    return event
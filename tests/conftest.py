@@ -1,10 +1,11 @@
 from collections.abc import Generator
-from datetime import datetime
+from functools import cache
 from typing import Any
 
 import pytest
 
 from athm.client import ATHMovilClient
+from athm.constants import BASE_URL, ENDPOINTS
 from athm.models import TransactionStatus
 
 # Sample tokens for testing
@@ -16,6 +17,17 @@ SAMPLE_AUTH_TOKEN = (
 )
 SAMPLE_ECOMMERCE_ID = "550e8400-e29b-41d4-a716-446655440000"
 SAMPLE_REFERENCE_NUMBER = "REF-2024-001234"
+# Fixed timestamps keep payloads deterministic; no test depends on the current time
+SAMPLE_TRANSACTION_DATE = "2025-01-15 10:30:00"
+SAMPLE_TIMESTAMP = "1736937000"
+
+# Endpoint URLs the client tests register mocked responses for
+AUTHORIZATION_URL = f"{BASE_URL}{ENDPOINTS['authorization']}"
+CANCEL_URL = f"{BASE_URL}{ENDPOINTS['cancel']}"
+FIND_PAYMENT_URL = f"{BASE_URL}{ENDPOINTS['find_payment']}"
+PAYMENT_URL = f"{BASE_URL}{ENDPOINTS['payment']}"
+REFUND_URL = f"{BASE_URL}{ENDPOINTS['refund']}"
+UPDATE_PHONE_URL = f"{BASE_URL}{ENDPOINTS['update_phone']}"
 
 
 @pytest.fixture
@@ -45,6 +57,8 @@ def reference_number() -> str:
 
 @pytest.fixture
 def client(public_token: str, private_token: str) -> Generator[ATHMovilClient, None, None]:
+    # The client owns its httpx.Client here, as it does for callers that don't
+    # pass http_client; the injected-client path has its own tests
     client = ATHMovilClient(
         public_token=public_token,
         private_token=private_token,
@@ -54,7 +68,11 @@ def client(public_token: str, private_token: str) -> Generator[ATHMovilClient, N
     client.close()
 
 
-@pytest.fixture
+# Static payloads are built once per session and shared between tests, so tests
+# must copy them before making changes
+
+
+@pytest.fixture(scope="session")
 def mock_payment_request() -> dict[str, Any]:
     return {
         "env": "production",
@@ -78,7 +96,7 @@ def mock_payment_request() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_payment_response() -> dict[str, Any]:
     return {
         "status": "success",
@@ -89,7 +107,7 @@ def mock_payment_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_transaction_response() -> dict[str, Any]:
     return {
         "status": "success",
@@ -98,7 +116,7 @@ def mock_transaction_response() -> dict[str, Any]:
             "ecommerceId": SAMPLE_ECOMMERCE_ID,
             "referenceNumber": SAMPLE_REFERENCE_NUMBER,
             "businessCustomerId": "BUS123",
-            "transactionDate": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "transactionDate": SAMPLE_TRANSACTION_DATE,
             "dailyTransactionId": 12345,  # API returns as int
             "businessName": "Test Business",
             "businessPath": "/test",
@@ -125,7 +143,7 @@ def mock_transaction_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_refund_response() -> dict[str, Any]:
     return {
         "status": "success",
@@ -134,7 +152,7 @@ def mock_refund_response() -> dict[str, Any]:
                 "transactionType": "REFUND",
                 "status": "COMPLETED",
                 "refundedAmount": 50.00,
-                "date": str(int(datetime.now().timestamp())),
+                "date": SAMPLE_TIMESTAMP,
                 "referenceNumber": "REFUND123",
                 "dailyTransactionId": 2,  # API returns as int
                 "name": "John Doe",
@@ -144,7 +162,7 @@ def mock_refund_response() -> dict[str, Any]:
             "originalTransaction": {
                 "transactionType": "PAYMENT",
                 "status": "COMPLETED",
-                "date": str(int(datetime.now().timestamp())),
+                "date": SAMPLE_TIMESTAMP,
                 "referenceNumber": SAMPLE_REFERENCE_NUMBER,
                 "dailyTransactionId": 1,  # API returns as int
                 "name": "John Doe",
@@ -165,7 +183,7 @@ def mock_refund_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_error_response() -> dict[str, Any]:
     return {
         "status": "error",
@@ -175,7 +193,7 @@ def mock_error_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_auth_error_response() -> dict[str, Any]:
     return {
         "status": "error",
@@ -185,7 +203,7 @@ def mock_auth_error_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_success_response() -> dict[str, Any]:
     return {
         "status": "success",
@@ -197,7 +215,7 @@ def mock_success_response() -> dict[str, Any]:
 # Ref: https://github.com/evertec/athmovil-webhooks
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_payment_payload() -> dict[str, Any]:
     """Standard payment webhook payload (uses string decimals)."""
     return {
@@ -231,7 +249,7 @@ def mock_webhook_payment_payload() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_ecommerce_completed_payload() -> dict[str, Any]:
     """eCommerce completed webhook payload (uses numbers, different field names)."""
     return {
@@ -272,7 +290,7 @@ def mock_webhook_ecommerce_completed_payload() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_ecommerce_cancelled_payload() -> dict[str, Any]:
     """eCommerce cancelled webhook payload."""
     return {
@@ -300,7 +318,7 @@ def mock_webhook_ecommerce_cancelled_payload() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_refund_payload() -> dict[str, Any]:
     """Refund webhook payload."""
     return {
@@ -325,7 +343,7 @@ def mock_webhook_refund_payload() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_webhook_subscription_response() -> dict[str, Any]:
     """Successful webhook subscription response."""
     return {
@@ -334,6 +352,8 @@ def mock_webhook_subscription_response() -> dict[str, Any]:
     }
 
 
+# Memoized per status like the session-scoped fixtures above; callers must not mutate the result
+@cache
 def create_mock_transaction(status: TransactionStatus = TransactionStatus.OPEN) -> dict[str, Any]:
     return {
         "status": "success",
@@ -344,7 +364,7 @@ def create_mock_transaction(status: TransactionStatus = TransactionStatus.OPEN)
             if status == TransactionStatus.COMPLETED
             else "",
             "businessCustomerId": "BUS123",
-            "transactionDate": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "transactionDate": SAMPLE_TRANSACTION_DATE
             if status == TransactionStatus.COMPLETED
             else "",
             "dailyTransactionId": 12345,  # API returns as int
@@ -0,0 +1,615 @@
+"""Unit tests for the asynchronous ATH Móvil Client."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from athm.async_client import AsyncATHMovilClient
+from athm.constants import WEBHOOK_BASE_URL, WEBHOOK_SUBSCRIBE_ENDPOINT
+from athm.exceptions import (
+    ATHMovilError,
+    AuthenticationError,
+    NetworkError,
+    TimeoutError,
+    TransactionError,
+    ValidationError,
+)
+from athm.models import (
+    PaymentResponse,
+    RefundResponse,
+    SuccessResponse,
+    TransactionResponse,
+    TransactionStatus,
+)
+from tests.conftest import (
+    AUTHORIZATION_URL,
+    CANCEL_URL,
+    FIND_PAYMENT_URL,
+    PAYMENT_URL,
+    REFUND_URL,
+    SAMPLE_ECOMMERCE_ID,
+    UPDATE_PHONE_URL,
+    create_mock_transaction,
+)
+
+
+class TestAsyncClientInitialization:
+    def test_init_without_public_token(self):
+        with pytest.raises(ValidationError, match="public_token is required"):
+            AsyncATHMovilClient(public_token="")
+
+    def test_async_context_manager(self, public_token: str):
+        async def run() -> AsyncATHMovilClient:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                assert client._http_client is not None
+            return client
+
+        client = asyncio.run(run())
+        assert client._http_client is None
+
+    def test_lazy_client_and_aclose(self, public_token: str):
+        async def run() -> None:
+            client = AsyncATHMovilClient(public_token=public_token)
+            assert client._http_client is None
+            assert isinstance(client.async_client, httpx.AsyncClient)
+            await client.aclose()
+            assert client._http_client is None
+
+        asyncio.run(run())
+
+
+class TestAsyncPaymentOperations:
+    def test_create_payment_success(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        mock_payment_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=PAYMENT_URL,
+            json=mock_payment_response,
+        )
+
+        async def run() -> tuple[PaymentResponse, str | None]:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                response = await client.create_payment(
+                    total="5.00",
+                    phone_number="7875551234",
+                    metadata1="Test",
+                    metadata2="Test",
+                    items=[
+                        {"name": "Test", "description": "Test", "quantity": "1", "price": "5.00"}
+                    ],
+                )
+                return response, client._auth_tokens.get(SAMPLE_ECOMMERCE_ID)
+
+        response, stored_token = asyncio.run(run())
+
+        assert isinstance(response, PaymentResponse)
+        assert response.data.ecommerce_id == SAMPLE_ECOMMERCE_ID
+        assert stored_token == response.data.auth_token
+
+    def test_create_payment_validation_error(self, public_token: str):
+        async def run() -> None:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                await client.create_payment(
+                    total="0.50",
+                    phone_number="123",
+                    items=[
+                        {"name": "Test", "description": "Test", "quantity": "1", "price": "0.50"}
+                    ],
+                )
+
+        with pytest.raises(ValidationError):
+            asyncio.run(run())
+
+    def test_authorize_payment_success(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        auth_token: str,
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=AUTHORIZATION_URL,
+            json=create_mock_transaction(TransactionStatus.COMPLETED),
+        )
+
+        async def run() -> TransactionResponse:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                client._store_auth_token(ecommerce_id, auth_token)
+                return await client.authorize_payment(ecommerce_id)
+
+        response = asyncio.run(run())
+
+        assert response.data
+        assert response.data.ecommerce_status == TransactionStatus.COMPLETED
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["Authorization"] == f"Bearer {auth_token}"
+
+    def test_authorize_payment_no_token(self, public_token: str, ecommerce_id: str):
+        async def run() -> None:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                await client.authorize_payment(ecommerce_id)
+
+        with pytest.raises(AuthenticationError, match="No auth token available"):
+            asyncio.run(run())
+
+    def test_update_phone_success(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        auth_token: str,
+        mock_success_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="PUT",
+            url=UPDATE_PHONE_URL,
+            json=mock_success_response,
+        )
+
+        async def run() -> SuccessResponse:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.update_phone_number(
+                    ecommerce_id, "7875559999", auth_token=auth_token
+                )
+
+        assert asyncio.run(run()).status == "success"
+
+    def test_update_phone_errors(self, public_token: str, ecommerce_id: str, auth_token: str):
+        async def run(token: str | None) -> None:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                await client.update_phone_number(ecommerce_id, "123", auth_token=token)
+
+        with pytest.raises(AuthenticationError):
+            asyncio.run(run(None))
+        with pytest.raises(ValidationError):
+            asyncio.run(run(auth_token))
+
+    def test_cancel_payment_success(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_success_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=CANCEL_URL,
+            json=mock_success_response,
+        )
+
+        async def run() -> tuple[SuccessResponse, bool]:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                client._store_auth_token(ecommerce_id, "test_token")
+                response = await client.cancel_payment(ecommerce_id)
+                return response, ecommerce_id in client._auth_tokens
+
+        response, still_stored = asyncio.run(run())
+
+        assert response.status == "success"
+        assert not still_stored
+
+    def test_refund_payment_success(
+        self,
+        public_token: str,
+        private_token: str,
+        httpx_mock: HTTPXMock,
+        reference_number: str,
+        mock_refund_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=REFUND_URL,
+            json=mock_refund_response,
+        )
+
+        async def run() -> RefundResponse:
+            async with AsyncATHMovilClient(
+                public_token=public_token, private_token=private_token
+            ) as client:
+                return await client.refund_payment(reference_number, "5.00", message="Refund")
+
+        assert isinstance(asyncio.run(run()), RefundResponse)
+
+    def test_refund_payment_errors(
+        self, public_token: str, private_token: str, reference_number: str
+    ):
+        async def run(token: str | None, amount: str) -> None:
+            async with AsyncATHMovilClient(
+                public_token=public_token, private_token=token
+            ) as client:
+                await client.refund_payment(reference_number, amount)
+
+        with pytest.raises(AuthenticationError, match="Private token required"):
+            asyncio.run(run(None, "5.00"))
+        with pytest.raises(ValidationError):
+            asyncio.run(run(private_token, "0.00"))
+
+
+class TestAsyncFindPayment:
+    def test_find_payment_success(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(method="POST", url=FIND_PAYMENT_URL, json=mock_transaction_response)
+
+        async def run() -> TransactionResponse:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.find_payment(ecommerce_id)
+
+        response = asyncio.run(run())
+
+        assert isinstance(response, TransactionResponse)
+        assert response.data
+        assert response.data.ecommerce_status == TransactionStatus.CONFIRM
+
+    def test_find_payment_concurrently(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=mock_transaction_response,
+            is_reusable=True,
+        )
+
+        async def run() -> list[TransactionResponse]:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await asyncio.gather(*(client.find_payment(ecommerce_id) for _ in range(5)))
+
+        responses = asyncio.run(run())
+
+        assert len(responses) == 5
+        assert len(httpx_mock.get_requests()) == 5
+
+    def test_shared_http_client_is_not_closed(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=mock_transaction_response,
+            is_reusable=True,
+        )
+
+        async def run() -> bool:
+            async with httpx.AsyncClient() as http_client:
+                for _ in range(2):
+                    async with AsyncATHMovilClient(
+                        public_token=public_token, http_client=http_client
+                    ) as client:
+                        await client.find_payment(ecommerce_id)
+                return http_client.is_closed
+
+        assert asyncio.run(run()) is False
+        for request in httpx_mock.get_requests():
+            assert request.headers["Content-Type"] == "application/json"
+
+    def test_network_error_with_retry(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("athm.async_client.asyncio.sleep", fake_sleep)
+        httpx_mock.add_exception(httpx.NetworkError("Connection failed"))
+        httpx_mock.add_response(method="POST", url=FIND_PAYMENT_URL, json=mock_transaction_response)
+
+        async def run() -> TransactionResponse:
+            async with AsyncATHMovilClient(public_token=public_token, max_retries=1) as client:
+                return await client.find_payment(ecommerce_id)
+
+        assert asyncio.run(run()).data
+        assert len(sleeps) == 1
+
+    def test_timeout_retries_exhausted(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        async def fake_sleep(delay: float) -> None:
+            pass
+
+        monkeypatch.setattr("athm.async_client.asyncio.sleep", fake_sleep)
+        for _ in range(2):
+            httpx_mock.add_exception(httpx.TimeoutException("Request timed out"))
+
+        async def run() -> None:
+            async with AsyncATHMovilClient(public_token=public_token, max_retries=1) as client:
+                await client.find_payment(ecommerce_id)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(run())
+
+    def test_rate_limited_response_honors_retry_after(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("athm.async_client.asyncio.sleep", fake_sleep)
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json={"status": "error", "message": "Too many requests"},
+            status_code=429,
+            headers={"Retry-After": "2"},
+        )
+        httpx_mock.add_response(method="POST", url=FIND_PAYMENT_URL, json=mock_transaction_response)
+
+        async def run() -> TransactionResponse:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.find_payment(ecommerce_id)
+
+        assert asyncio.run(run()).data
+        assert sleeps == [2.0]
+
+    @pytest.mark.parametrize(
+        ("url", "call"),
+        [
+            (
+                AUTHORIZATION_URL,
+                lambda client: client.authorize_payment(SAMPLE_ECOMMERCE_ID, auth_token="token"),
+            ),
+            (REFUND_URL, lambda client: client.refund_payment("REF123", "5.00")),
+        ],
+    )
+    def test_service_unavailable_not_retried_for_unsafe_requests(
+        self,
+        public_token: str,
+        private_token: str,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
+        url: str,
+        call: Callable[[AsyncATHMovilClient], Awaitable[Any]],
+    ):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("athm.async_client.asyncio.sleep", fake_sleep)
+        httpx_mock.add_response(
+            method="POST",
+            url=url,
+            json={"status": "error", "message": "Service unavailable"},
+            status_code=503,
+        )
+
+        async def run() -> None:
+            async with AsyncATHMovilClient(
+                public_token=public_token, private_token=private_token
+            ) as client:
+                await call(client)
+
+        with pytest.raises(ATHMovilError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 503
+        assert sleeps == []
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.parametrize("method", ["find_payment", "cancel_payment"])
+    def test_invalid_ecommerce_id(self, public_token: str, method: str):
+        async def run() -> None:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                await getattr(client, method)(None)
+
+        with pytest.raises(ValidationError, match="ecommerce_id"):
+            asyncio.run(run())
+
+    def test_http_error(self, public_token: str, httpx_mock: HTTPXMock, ecommerce_id: str):
+        httpx_mock.add_exception(httpx.HTTPError("HTTP error"))
+
+        async def run() -> None:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                await client.find_payment(ecommerce_id)
+
+        with pytest.raises(NetworkError, match="HTTP error"):
+            asyncio.run(run())
+
+
+class TestAsyncWaitForConfirmation:
+    def test_wait_for_confirmation_success(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("athm.async_client.asyncio.sleep", fake_sleep)
+        for status in (TransactionStatus.OPEN, TransactionStatus.CONFIRM):
+            httpx_mock.add_response(
+                method="POST", url=FIND_PAYMENT_URL, json=create_mock_transaction(status)
+            )
+
+        async def run() -> bool:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.wait_for_confirmation(ecommerce_id, polling_interval=0.1)
+
+        assert asyncio.run(run()) is True
+        assert len(sleeps) == 1
+
+    def test_wait_for_confirmation_cancelled(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=create_mock_transaction(TransactionStatus.CANCEL),
+        )
+
+        async def run() -> bool:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.wait_for_confirmation(ecommerce_id)
+
+        with pytest.raises(TransactionError, match="Payment was cancelled"):
+            asyncio.run(run())
+
+    def test_wait_for_confirmation_timeout(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=create_mock_transaction(TransactionStatus.OPEN),
+            is_reusable=True,
+        )
+
+        clock = [0.0]
+
+        async def fake_sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        monkeypatch.setattr("athm.async_client.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("athm.async_client.asyncio.sleep", fake_sleep)
+
+        async def run() -> bool:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.wait_for_confirmation(
+                    ecommerce_id, timeout=60, polling_interval=1.0
+                )
+
+        with pytest.raises(TimeoutError, match="Payment not confirmed within"):
+            asyncio.run(run())
+        assert clock[0] == pytest.approx(60.0)
+        # Backoff keeps the number of polls far below timeout / polling_interval
+        assert len(httpx_mock.get_requests()) < 10
+
+    def test_wait_for_confirmation_zero_timeout(
+        self, public_token: str, httpx_mock: HTTPXMock, ecommerce_id: str
+    ):
+        async def run() -> bool:
+            async with AsyncATHMovilClient(public_token=public_token) as client:
+                return await client.wait_for_confirmation(ecommerce_id, timeout=0)
+
+        with pytest.raises(TimeoutError, match="Payment not confirmed within"):
+            asyncio.run(run())
+        assert httpx_mock.get_requests() == []
+
+
+class TestAsyncSubscribeWebhook:
+    WEBHOOK_URL = f"{WEBHOOK_BASE_URL}{WEBHOOK_SUBSCRIBE_ENDPOINT}"
+
+    def test_subscribe_webhook_success(
+        self,
+        public_token: str,
+        private_token: str,
+        httpx_mock: HTTPXMock,
+        mock_webhook_subscription_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST", url=self.WEBHOOK_URL, json=mock_webhook_subscription_response
+        )
+
+        async def run() -> dict[str, Any]:
+            async with AsyncATHMovilClient(
+                public_token=public_token, private_token=private_token
+            ) as client:
+                return await client.subscribe_webhook(
+                    listener_url="https://example.com/webhook", refund_sent=False
+                )
+
+        assert asyncio.run(run())["status"] == "success"
+        request = httpx_mock.get_request()
+        assert request is not None
+        body = json.loads(request.content)
+        assert body["listenerURL"] == "https://example.com/webhook"
+        assert body["refundSentEvent"] is False
+
+    @pytest.mark.parametrize(
+        ("private_token", "listener_url", "error"),
+        [
+            (None, "https://example.com/webhook", AuthenticationError),
+            ("private", "http://example.com/webhook", ValidationError),
+        ],
+    )
+    def test_subscribe_webhook_invalid(
+        self,
+        public_token: str,
+        private_token: str | None,
+        listener_url: str,
+        error: type[Exception],
+    ):
+        async def run() -> None:
+            async with AsyncATHMovilClient(
+                public_token=public_token, private_token=private_token
+            ) as client:
+                await client.subscribe_webhook(listener_url=listener_url)
+
+        with pytest.raises(error):
+            asyncio.run(run())
+
+    @pytest.mark.parametrize(
+        ("exception", "error"),
+        [
+            (httpx.TimeoutException("Connection timed out"), TimeoutError),
+            (httpx.ConnectError("Connection refused"), NetworkError),
+        ],
+    )
+    def test_subscribe_webhook_transport_errors(
+        self,
+        public_token: str,
+        private_token: str,
+        httpx_mock: HTTPXMock,
+        exception: httpx.HTTPError,
+        error: type[Exception],
+    ):
+        httpx_mock.add_exception(exception)
+
+        async def run() -> None:
+            async with AsyncATHMovilClient(
+                public_token=public_token, private_token=private_token
+            ) as client:
+                await client.subscribe_webhook(listener_url="https://example.com/webhook")
+
+        with pytest.raises(error):
+            asyncio.run(run())
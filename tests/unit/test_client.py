@@ -1,13 +1,18 @@
 """Unit tests for ATH Móvil Client."""
 
+import importlib
+import sys
+from collections.abc import Callable
 from typing import Any
 
 import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
+from athm import _json
+from athm._base_client import _parse_retry_after
 from athm.client import ATHMovilClient
-from athm.constants import ENDPOINTS
+from athm.constants import DEFAULT_HEADERS, ENDPOINTS, POLLING_JITTER, RETRY_BASE
 from athm.exceptions import (
     ATHMovilError,
     AuthenticationError,
@@ -17,7 +22,24 @@ from athm.exceptions import (
     ValidationError,
 )
 from athm.models import PaymentResponse, TransactionResponse, TransactionStatus
-from tests.conftest import SAMPLE_ECOMMERCE_ID, create_mock_transaction
+from tests.conftest import (
+    AUTHORIZATION_URL,
+    CANCEL_URL,
+    FIND_PAYMENT_URL,
+    PAYMENT_URL,
+    REFUND_URL,
+    SAMPLE_ECOMMERCE_ID,
+    UPDATE_PHONE_URL,
+    create_mock_transaction,
+)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    # Record retry and polling delays instead of sleeping through them
+    sleeps: list[float] = []
+    monkeypatch.setattr("athm.client.time.sleep", sleeps.append)
+    return sleeps
 
 
 class TestClientInitialization:
@@ -35,13 +57,10 @@ class TestClientInitialization:
         assert client.public_token == public_token
         assert client.private_token == private_token
 
-    def test_init_without_public_token(self):
-        with pytest.raises(ValidationError, match="public_token is required"):
-            ATHMovilClient(public_token="")
-
-    def test_init_with_whitespace_token(self):
-        with pytest.raises(ValidationError, match="cannot be empty"):
-            ATHMovilClient(public_token="   ")
+    @pytest.mark.parametrize(("token", "match"), [("", "required"), ("   ", "cannot be empty")])
+    def test_init_with_empty_public_token(self, token: str, match: str):
+        with pytest.raises(ValidationError, match=match):
+            ATHMovilClient(public_token=token)
 
     def test_custom_configuration(self, public_token: str):
         client = ATHMovilClient(
@@ -56,11 +75,47 @@ class TestClientInitialization:
         assert client.max_retries == 5
         assert client.verify_ssl is False
 
+    def test_requests_use_custom_base_url(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=f"https://custom.api.com{ENDPOINTS['find_payment']}",
+            json=mock_transaction_response,
+        )
+
+        with ATHMovilClient(
+            public_token=public_token, base_url="https://custom.api.com/"
+        ) as client:
+            assert client.find_payment(ecommerce_id).data
+
+    def test_slots(self, public_token: str):
+        client = ATHMovilClient(public_token=public_token)
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = True  # type: ignore[attr-defined]
+
+    def test_auth_headers(self, public_token: str):
+        client = ATHMovilClient(public_token=public_token)
+        assert client._prepare_headers() is None
+        assert client._prepare_headers("token") == {"Authorization": "Bearer token"}
+
+        with httpx.Client() as http_client:
+            shared = ATHMovilClient(public_token=public_token, http_client=http_client)
+            assert shared._prepare_headers("token") == {
+                **DEFAULT_HEADERS,
+                "Authorization": "Bearer token",
+            }
+
     def test_context_manager(self, public_token: str):
         with ATHMovilClient(public_token=public_token) as client:
-            assert client._sync_client is not None
+            assert client._http_client is not None
         # After exiting context, client should be closed
-        assert client._sync_client is None
+        assert client._http_client is None
 
 
 class TestPaymentOperations:
@@ -72,7 +127,7 @@ class TestPaymentOperations:
     ):
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['payment']}",
+            url=PAYMENT_URL,
             json=mock_payment_response,
             status_code=200,
         )
@@ -98,6 +153,24 @@ class TestPaymentOperations:
         # Check that auth token is stored internally
         assert client._auth_tokens.get(SAMPLE_ECOMMERCE_ID)
 
+    def test_stored_auth_tokens_are_lru_bounded(
+        self, client: ATHMovilClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("athm._base_client.MAX_STORED_AUTH_TOKENS", 2)
+
+        client._store_auth_token("first", "token-1")
+        client._store_auth_token("second", "token-2")
+        client._store_auth_token("third", "token-3")
+
+        assert list(client._auth_tokens) == ["second", "third"]
+
+        # Reading a token marks it as recently used
+        assert client._stored_auth_token("second") == "token-2"
+        client._store_auth_token("fourth", "token-4")
+
+        assert list(client._auth_tokens) == ["second", "fourth"]
+        assert client._stored_auth_token("third") is None
+
     def test_create_payment_validation_error(self, client: ATHMovilClient):
         with pytest.raises(ValidationError):
             client.create_payment(
@@ -114,7 +187,7 @@ class TestPaymentOperations:
     ):
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['payment']}",
+            url=PAYMENT_URL,
             json=mock_error_response,
             status_code=400,
         )
@@ -139,7 +212,7 @@ class TestFindPaymentOperations:
     ):
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=mock_transaction_response,
             status_code=200,
         )
@@ -150,6 +223,11 @@ class TestFindPaymentOperations:
         assert response.data
         assert response.data.ecommerce_status == TransactionStatus.CONFIRM
 
+    @pytest.mark.parametrize("method", ["find_payment", "cancel_payment"])
+    def test_invalid_ecommerce_id(self, client: ATHMovilClient, method: str):
+        with pytest.raises(ValidationError, match="ecommerce_id"):
+            getattr(client, method)(None)
+
     def test_find_payment_not_found(
         self,
         client: ATHMovilClient,
@@ -165,7 +243,7 @@ class TestFindPaymentOperations:
 
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=error_response,
             status_code=404,
         )
@@ -181,12 +259,13 @@ class TestWaitForConfirmation:
         client: ATHMovilClient,
         httpx_mock: HTTPXMock,
         ecommerce_id: str,
+        sleeps: list[float],
     ):
         # First poll: OPEN status
         open_response = create_mock_transaction(TransactionStatus.OPEN)
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=open_response,
             status_code=200,
         )
@@ -195,13 +274,14 @@ class TestWaitForConfirmation:
         confirm_response = create_mock_transaction(TransactionStatus.CONFIRM)
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=confirm_response,
             status_code=200,
         )
 
         result = client.wait_for_confirmation(ecommerce_id, polling_interval=0.1)
         assert result is True
+        assert len(sleeps) == 1
 
     def test_wait_for_confirmation_immediate(
         self,
@@ -213,7 +293,7 @@ class TestWaitForConfirmation:
         confirm_response = create_mock_transaction(TransactionStatus.CONFIRM)
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=confirm_response,
             status_code=200,
         )
@@ -226,20 +306,47 @@ class TestWaitForConfirmation:
         client: ATHMovilClient,
         httpx_mock: HTTPXMock,
         ecommerce_id: str,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         # Always return OPEN status
-        # timeout=1s, interval=0.1s = 11 polls (0.0, 0.1, 0.2, ..., 1.0)
-        open_response = create_mock_transaction(TransactionStatus.OPEN)
-        for _ in range(11):
-            httpx_mock.add_response(
-                method="POST",
-                url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
-                json=open_response,
-                status_code=200,
-            )
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=create_mock_transaction(TransactionStatus.OPEN),
+            status_code=200,
+            is_reusable=True,
+        )
+
+        clock = [0.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr("athm.client.time.monotonic", lambda: clock[0])
+        monkeypatch.setattr("athm.client.time.sleep", fake_sleep)
 
         with pytest.raises(TimeoutError, match="Payment not confirmed within"):
-            client.wait_for_confirmation(ecommerce_id, timeout=1, polling_interval=0.1)
+            client.wait_for_confirmation(ecommerce_id, timeout=60, polling_interval=1.0)
+
+        # Waits double from the initial interval up to the cap, with jitter,
+        # and the last one is trimmed to the deadline
+        for expected, actual in zip([1.0, 2.0, 4.0, 8.0, 15.0, 15.0], sleeps, strict=False):
+            assert expected <= actual <= expected * (1 + POLLING_JITTER)
+        assert clock[0] == pytest.approx(60.0)
+        assert len(httpx_mock.get_requests()) == len(sleeps) + 1
+
+    def test_wait_for_confirmation_zero_timeout(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+    ):
+        # Gives up before polling at all
+        with pytest.raises(TimeoutError, match="Payment not confirmed within"):
+            client.wait_for_confirmation(ecommerce_id, timeout=0)
+        assert httpx_mock.get_requests() == []
 
     def test_wait_for_confirmation_cancelled(
         self,
@@ -251,7 +358,7 @@ class TestWaitForConfirmation:
         cancel_response = create_mock_transaction(TransactionStatus.CANCEL)
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=cancel_response,
             status_code=200,
         )
@@ -259,6 +366,31 @@ class TestWaitForConfirmation:
         with pytest.raises(TransactionError, match="Payment was cancelled"):
             client.wait_for_confirmation(ecommerce_id)
 
+    def test_wait_for_confirmation_missing_data(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        sleeps: list[float],
+    ):
+        # A poll without transaction data keeps waiting
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json={"status": "success", "data": None},
+            status_code=200,
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=create_mock_transaction(TransactionStatus.CONFIRM),
+            status_code=200,
+        )
+
+        result = client.wait_for_confirmation(ecommerce_id, polling_interval=0.1)
+        assert result is True
+        assert len(sleeps) == 1
+
 
 class TestAuthorizationOperations:
     def test_authorize_payment_success(
@@ -274,7 +406,7 @@ class TestAuthorizationOperations:
         completed_response = create_mock_transaction(TransactionStatus.COMPLETED)
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['authorization']}",
+            url=AUTHORIZATION_URL,
             json=completed_response,
             status_code=200,
         )
@@ -303,7 +435,7 @@ class TestAuthorizationOperations:
         completed_response = create_mock_transaction(TransactionStatus.COMPLETED)
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['authorization']}",
+            url=AUTHORIZATION_URL,
             json=completed_response,
             status_code=200,
         )
@@ -313,6 +445,29 @@ class TestAuthorizationOperations:
         assert response.data
         assert response.data.ecommerce_status == TransactionStatus.COMPLETED
 
+    def test_authorize_payment_request_body(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        auth_token: str,
+    ):
+        completed_response = create_mock_transaction(TransactionStatus.COMPLETED)
+        httpx_mock.add_response(
+            method="POST",
+            url=AUTHORIZATION_URL,
+            json=completed_response,
+            status_code=200,
+        )
+
+        client.authorize_payment(ecommerce_id, auth_token=auth_token)
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.content == b"{}"
+        assert request.headers["Content-Type"] == "application/json"
+        assert request.headers["Authorization"] == f"Bearer {auth_token}"
+
 
 class TestCancelOperations:
     def test_cancel_payment_success(
@@ -327,7 +482,7 @@ class TestCancelOperations:
 
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['cancel']}",
+            url=CANCEL_URL,
             json=mock_success_response,
             status_code=200,
         )
@@ -349,7 +504,7 @@ class TestRefundOperations:
     ):
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['refund']}",
+            url=REFUND_URL,
             json=mock_refund_response,
             status_code=200,
         )
@@ -395,7 +550,7 @@ class TestUpdatePhoneOperations:
 
         httpx_mock.add_response(
             method="PUT",
-            url=f"https://payments.athmovil.com{ENDPOINTS['update_phone']}",
+            url=UPDATE_PHONE_URL,
             json=mock_success_response,
             status_code=200,
         )
@@ -426,6 +581,7 @@ class TestUpdatePhoneOperations:
 
 
 class TestErrorHandling:
+    @pytest.mark.usefixtures("sleeps")
     def test_network_error_with_retry(
         self,
         client: ATHMovilClient,
@@ -440,13 +596,14 @@ class TestErrorHandling:
         # Second attempt: success
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             json=mock_transaction_response,
         )
 
         response = client.find_payment(ecommerce_id)
         assert response.data
 
+    @pytest.mark.usefixtures("sleeps")
     def test_timeout_error_max_retries(
         self,
         client: ATHMovilClient,
@@ -462,6 +619,154 @@ class TestErrorHandling:
         with pytest.raises(TimeoutError):
             client.find_payment(ecommerce_id)
 
+    def test_retry_backoff_schedule(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        sleeps: list[float],
+    ):
+        client.max_retries = 3
+
+        for _ in range(4):
+            httpx_mock.add_exception(httpx.TimeoutException("Request timed out"))
+
+        with pytest.raises(TimeoutError):
+            client.find_payment(ecommerce_id)
+
+        assert len(sleeps) == 3
+        for attempt, backoff in enumerate(sleeps):
+            assert 0 <= backoff <= RETRY_BASE * 2**attempt
+
+    def test_rate_limited_response_honors_retry_after(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+        sleeps: list[float],
+    ):
+
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json={"status": "error", "message": "Too many requests"},
+            status_code=429,
+            headers={"Retry-After": "2"},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=mock_transaction_response,
+        )
+
+        response = client.find_payment(ecommerce_id)
+        assert response.data
+        assert sleeps == [2.0]
+
+    def test_service_unavailable_retries_exhausted(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        sleeps: list[float],
+    ):
+        client.max_retries = 2
+
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json={"status": "error", "message": "Service unavailable"},
+            status_code=503,
+            is_reusable=True,
+        )
+
+        with pytest.raises(ATHMovilError) as exc_info:
+            client.find_payment(ecommerce_id)
+        assert exc_info.value.status_code == 503
+        assert len(sleeps) == 2
+
+    @pytest.mark.parametrize(
+        ("url", "call"),
+        [
+            (
+                AUTHORIZATION_URL,
+                lambda client: client.authorize_payment(SAMPLE_ECOMMERCE_ID, auth_token="token"),
+            ),
+            (REFUND_URL, lambda client: client.refund_payment("REF123", "5.00")),
+        ],
+    )
+    def test_service_unavailable_not_retried_for_unsafe_requests(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        sleeps: list[float],
+        url: str,
+        call: Callable[[ATHMovilClient], Any],
+    ):
+        # The server may have acted on the request, so resending could duplicate it
+        httpx_mock.add_response(
+            method="POST",
+            url=url,
+            json={"status": "error", "message": "Service unavailable"},
+            status_code=503,
+        )
+
+        with pytest.raises(ATHMovilError) as exc_info:
+            call(client)
+        assert exc_info.value.status_code == 503
+        assert sleeps == []
+        assert len(httpx_mock.get_requests()) == 1
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, None),
+            ("", None),
+            ("3", 3.0),
+            ("-1", 0.0),
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+            ("Wed, 21 Oct 2015 07:28:00 -0000", 0.0),
+            ("soon", None),
+        ],
+    )
+    def test_parse_retry_after(self, value: str | None, expected: float | None):
+        assert _parse_retry_after(value) == expected
+
+    @pytest.mark.parametrize(
+        ("exception", "expected_attempts"),
+        [
+            # The request may have reached the server, so it is not resent
+            (httpx.ReadTimeout("Read timed out"), 1),
+            (httpx.ReadError("Connection reset"), 1),
+            # The connection was never established, so resending is safe
+            (httpx.ConnectError("Connection refused"), 2),
+            (httpx.ConnectTimeout("Connect timed out"), 2),
+        ],
+    )
+    @pytest.mark.usefixtures("sleeps")
+    def test_create_payment_retries_only_unsent_requests(
+        self,
+        client: ATHMovilClient,
+        httpx_mock: HTTPXMock,
+        exception: httpx.TransportError,
+        expected_attempts: int,
+    ):
+        client.max_retries = 1
+        for _ in range(expected_attempts):
+            httpx_mock.add_exception(exception)
+
+        with pytest.raises((TimeoutError, NetworkError)):
+            client.create_payment(
+                total="5.00",
+                phone_number="7875551234",
+                metadata1="Test",
+                metadata2="Test",
+                items=[{"name": "Test", "description": "Test", "quantity": "1", "price": "5.00"}],
+            )
+
+        assert len(httpx_mock.get_requests()) == expected_attempts
+
     def test_invalid_json_response(
         self,
         client: ATHMovilClient,
@@ -470,7 +775,7 @@ class TestErrorHandling:
     ):
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['find_payment']}",
+            url=FIND_PAYMENT_URL,
             text="Not valid JSON",
             status_code=200,
         )
@@ -484,13 +789,38 @@ class TestClientCleanup:
         client = ATHMovilClient(public_token=public_token)
         # Force client creation
         _ = client.sync_client
-        assert client._sync_client is not None
+        assert client._http_client is not None
 
         client.close()
-        assert client._sync_client is None
+        assert client._http_client is None
+
+    def test_shared_http_client_is_not_closed(
+        self,
+        public_token: str,
+        httpx_mock: HTTPXMock,
+        ecommerce_id: str,
+        mock_transaction_response: dict[str, Any],
+    ):
+        httpx_mock.add_response(
+            method="POST",
+            url=FIND_PAYMENT_URL,
+            json=mock_transaction_response,
+            is_reusable=True,
+        )
+
+        with httpx.Client() as http_client:
+            for _ in range(2):
+                with ATHMovilClient(public_token=public_token, http_client=http_client) as client:
+                    client.find_payment(ecommerce_id)
+                assert client._http_client is http_client
+            assert not http_client.is_closed
+
+        for request in httpx_mock.get_requests():
+            assert request.headers["Content-Type"] == "application/json"
 
 
 class TestAdditionalCoverage:
+    @pytest.mark.usefixtures("sleeps")
     def test_network_error_retry_exhausted(
         self,
         client: ATHMovilClient,
@@ -516,3 +846,14 @@ class TestAdditionalCoverage:
 
         with pytest.raises(NetworkError, match="HTTP error"):
             client.find_payment(ecommerce_id)
+
+    def test_json_fallback_without_orjson(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        try:
+            fallback = importlib.reload(_json)
+            assert fallback.loads(b'{"status": "success"}') == {"status": "success"}
+            with pytest.raises(ValueError):
+                fallback.loads(b"Not valid JSON")
+        finally:
+            monkeypatch.undo()
+            importlib.reload(_json)
@@ -1,5 +1,9 @@
 """Unit tests for exception handling."""
 
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
 from pydantic import BaseModel, field_validator
 
 from athm.constants import ErrorCode
@@ -56,6 +60,28 @@ class TestATHMovilError:
         assert "ATHMovilError" in repr_str
         assert "Test" in repr_str
 
+    def test_attributes_are_slotted(self):
+        error = ValidationError("Test", error_code="CODE")
+        assert vars(error) == {}
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ATHMovilError("Test", error_code="CODE", status_code=400, response_data={"a": 1}),
+            ValidationError("Invalid", errors=[FieldError(field="total", message="bad")]),
+            TransactionError("Failed", error_code="BTRA_0007", status_code=400),
+        ],
+    )
+    def test_pickle_round_trip(self, error: ATHMovilError):
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        for name in ("message", "error_code", "status_code", "response_data"):
+            assert getattr(restored, name) == getattr(error, name)
+        if isinstance(error, ValidationError):
+            assert isinstance(restored, ValidationError)
+            assert restored.errors == error.errors
+
 
 class TestSpecificExceptions:
     def test_authentication_error(self):
@@ -102,6 +128,13 @@ class TestFieldError:
         assert error.message == "Invalid value"
         assert error.value == "0.50"
 
+    def test_field_error_is_immutable(self):
+        error = FieldError(field="total", message="Required")
+        assert not hasattr(error, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            error.message = "Changed"  # type: ignore[misc]
+        assert error == FieldError(field="total", message="Required")
+
 
 class TestValidationErrorFromPydantic:
     """Tests for ValidationError.from_pydantic() classmethod."""
@@ -45,6 +45,20 @@ class TestPaymentItem:
         assert item.price == "11.00"
         assert item.tax == "1.11"
 
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("10.00", "10.00"),
+            ("0.50", "0.50"),
+            ("010.00", "10.00"),
+            ("10.5", "10.50"),
+            ("10.00\n", "10.00"),
+        ],
+    )
+    def test_payment_item_canonical_amounts(self, raw: str, expected: str):
+        item = PaymentItem(name="Test", description="Test", quantity="1", price=raw)
+        assert item.price == expected
+
     def test_payment_item_negative_amount(self):
         with pytest.raises(ValidationError):
             PaymentItem(
@@ -146,6 +160,25 @@ class TestPaymentRequest:
                 metadata2="Test",
             )
 
+    @pytest.mark.parametrize(
+        ("total", "message"),
+        [
+            ("0.999", r"at least \$1\.00"),
+            ("1500.001", r"exceed \$1500\.00"),
+            ("1500.1", r"exceed \$1500\.00"),
+        ],
+    )
+    def test_payment_total_bounds_before_rounding(self, total: str, message: str):
+        with pytest.raises(ValidationError, match=message):
+            PaymentRequest(
+                publicToken="test",
+                total=total,
+                phoneNumber="7875551234",
+                metadata1="Test",
+                metadata2="Test",
+                items=[PaymentItem(name="Test", description="Test", quantity="1", price="1.00")],
+            )
+
     def test_payment_amount_validation(self):
         # Below minimum
         with pytest.raises(ValidationError, match="at least"):
@@ -375,6 +408,19 @@ class TestPaymentRequest:
                 ],
             )
 
+    def test_payment_totals_compare_normalized_amounts(self):
+        request = PaymentRequest(
+            publicToken="test",
+            total="100",
+            subtotal="90.5",
+            tax="9.50",
+            phoneNumber="7875551234",
+            metadata1="Test",
+            metadata2="Test",
+            items=[PaymentItem(name="Test", description="Test", quantity="1", price="90.50")],
+        )
+        assert (request.total, request.subtotal, request.tax) == ("100.00", "90.50", "9.50")
+
     def test_payment_with_items(self):
         items = [
             PaymentItem(
@@ -430,6 +476,20 @@ class TestTransactionModels:
         assert data.reference_number == "REF123"
         assert data.total == Decimal("100.00")
 
+    @pytest.mark.parametrize("value", ["2024-01-05 09:03:07", "2024-1-5 9:3:7"])
+    def test_transaction_date_parsing(self, value: str):
+        data = TransactionData(
+            ecommerceStatus="OPEN", ecommerceId="uuid-123", transactionDate=value
+        )
+        assert data.transaction_date == datetime(2024, 1, 5, 9, 3, 7)
+
+    @pytest.mark.parametrize(
+        "value", ["2024-01-05", "2024-01-05 09:03:07+04:00", "2024-01-05T09:03:07"]
+    )
+    def test_transaction_date_rejects_other_iso_forms(self, value: str):
+        with pytest.raises(ValidationError):
+            TransactionData(ecommerceStatus="OPEN", ecommerceId="uuid-123", transactionDate=value)
+
     def test_transaction_response(self):
         response = TransactionResponse(
             status="success",
@@ -451,6 +511,11 @@ class TestTransactionModels:
         assert response.status == "error"
         assert response.data is None
 
+    def test_transaction_response_is_frozen(self):
+        response = TransactionResponse(status="success", data=None)
+        with pytest.raises(ValidationError, match="frozen"):
+            response.status = "error"  # type: ignore[misc]
+
 
 class TestRefundModels:
     def test_refund_request(self):
@@ -478,7 +543,7 @@ class TestRefundModels:
             )
 
         # Zero amount
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError, match="positive"):
             RefundRequest(
                 publicToken="pub",
                 privateToken="priv",
@@ -6,6 +6,7 @@ from pydantic import ValidationError as PydanticValidationError
 from athm.client import ATHMovilClient
 from athm.exceptions import ValidationError
 from athm.models import PaymentItem, PaymentRequest
+from tests.conftest import PAYMENT_URL
 
 
 class TestPaymentItemValidation:
@@ -66,6 +67,14 @@ class TestPaymentItemValidation:
         )
         assert item2.price == "11.00"  # Rounded
 
+    @pytest.mark.parametrize(
+        ("price", "expected"),
+        [("10", "10.00"), ("007.5", "7.50"), ("0.05", "0.05"), ("1e1", "10.00"), (" 10 ", "10.00")],
+    )
+    def test_payment_item_price_normalization(self, price: str, expected: str):
+        item = PaymentItem(name="Product", description="Description", quantity="1", price=price)
+        assert item.price == expected
+
     def test_payment_item_negative_price(self):
         """Test that negative prices are rejected."""
         with pytest.raises(PydanticValidationError, match="Amount cannot be negative"):
@@ -263,11 +272,9 @@ class TestClientWithItems:
         self, client: ATHMovilClient, httpx_mock, mock_payment_response
     ):
         """Test create_payment with explicit items parameter."""
-        from athm.constants import ENDPOINTS
-
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['payment']}",
+            url=PAYMENT_URL,
             json=mock_payment_response,
             status_code=200,
         )
@@ -301,11 +308,9 @@ class TestClientWithItems:
         self, client: ATHMovilClient, httpx_mock, mock_payment_response
     ):
         """Test create_payment with empty items list."""
-        from athm.constants import ENDPOINTS
-
         httpx_mock.add_response(
             method="POST",
-            url=f"https://payments.athmovil.com{ENDPOINTS['payment']}",
+            url=PAYMENT_URL,
             json=mock_payment_response,
             status_code=200,
         )
@@ -1,5 +1,8 @@
 """Unit tests for webhook models and utilities."""
 
+import json
+from collections.abc import Callable
+from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
@@ -158,6 +161,44 @@ class TestParseWebhook:
         assert event.fee is None
         assert event.items == []
 
+    @pytest.mark.parametrize("encode", [json.dumps, lambda data: json.dumps(data).encode()])
+    def test_parse_raw_body(
+        self, mock_webhook_payment_payload: dict[str, Any], encode: Callable[[Any], str | bytes]
+    ):
+        event = parse_webhook(encode(mock_webhook_payment_payload))
+
+        assert event == parse_webhook(mock_webhook_payment_payload)
+
+    def test_parse_raw_body_invalid_json(self):
+        with pytest.raises(ValidationError, match="Invalid webhook payload"):
+            parse_webhook(b"{not json")
+
+    @pytest.mark.parametrize(
+        ("transaction_type", "status", "expected_type", "expected_status"),
+        [
+            ("ECOMMERCE", "CANCEL", WebhookEventType.ECOMMERCE, WebhookStatus.CANCELLED),
+            ("ecommerce", "expired", WebhookEventType.ECOMMERCE, WebhookStatus.EXPIRED),
+            ("Payment", "Cancel", WebhookEventType.PAYMENT, WebhookStatus.CANCELLED),
+        ],
+    )
+    def test_normalize_transaction_type_and_status(
+        self,
+        transaction_type: str,
+        status: str,
+        expected_type: WebhookEventType,
+        expected_status: WebhookStatus,
+    ):
+        event = parse_webhook(
+            {
+                "transactionType": transaction_type,
+                "status": status,
+                "date": "2025-01-15 10:30:00",
+                "total": "10.00",
+            }
+        )
+        assert event.transaction_type == expected_type
+        assert event.status == expected_status
+
     def test_parse_webhook_invalid_payload(self):
         """Test rejection of invalid payloads."""
         # Missing required field (transactionType)
@@ -170,6 +211,12 @@ class TestParseWebhook:
                 {"transactionType": "payment", "status": "completed", "date": "2025-01-15"}
             )
 
+    def test_parse_webhook_invalid_payload_field_errors(self):
+        with pytest.raises(ValidationError) as exc_info:
+            parse_webhook({"transactionType": "payment", "status": "completed", "date": "x"})
+
+        assert "total" in {error.field for error in exc_info.value.errors}
+
     def test_parse_webhook_invalid_decimal(self):
         """Test rejection of invalid decimal values."""
         payload = {
@@ -181,6 +228,19 @@ class TestParseWebhook:
         with pytest.raises(ValidationError, match="Invalid webhook payload"):
             parse_webhook(payload)
 
+    @pytest.mark.parametrize("field", ["date", "transactionDate"])
+    def test_parse_webhook_numeric_date(self, field: str):
+        """Test non-string dates raise the library ValidationError."""
+        payload = {
+            "transactionType": "payment",
+            "status": "completed",
+            "date": "2025-01-15 10:30:00",
+            "total": "10.00",
+            field: 1736938200,
+        }
+        with pytest.raises(ValidationError, match="Invalid webhook payload"):
+            parse_webhook(payload)
+
     def test_parse_webhook_item_with_null_tax(self):
         """Test item with null/empty tax field."""
         payload = {
@@ -241,7 +301,7 @@ class TestParseWebhook:
 
     def test_webhook_item_invalid_decimal(self):
         """Test WebhookItem with invalid decimal value."""
-        with pytest.raises(ValueError, match="Invalid decimal"):
+        with pytest.raises(ValueError, match="valid decimal"):
             WebhookItem(
                 name="Product",
                 description="Desc",
@@ -329,6 +389,23 @@ class TestParseWebhook:
         event4 = parse_webhook({**base_payload, "date": "2020-01-01T12:00:00.5"})
         assert event4.date.microsecond == 500000
 
+        # Unpadded fields fall back to strptime
+        event5 = parse_webhook({**base_payload, "date": "2020-1-1 9:05:00"})
+        assert event5.date == datetime(2020, 1, 1, 9, 5)
+
+        # Timezone offsets are not among the accepted formats
+        with pytest.raises(ValidationError, match="Unable to parse datetime"):
+            parse_webhook({**base_payload, "date": "2020-01-01T12:00:00+04:00"})
+
+    @pytest.mark.parametrize(
+        "value", ["2025-01-15 10:30+04", "2025-W03-3 10:30:00", "2025-01-15T10:30:00Z"]
+    )
+    def test_parse_datetime_rejects_other_iso_forms(self, value: str):
+        """Test ISO forms outside the webhook formats don't slip through fromisoformat."""
+        payload = {"transactionType": "payment", "status": "completed", "total": "10.00"}
+        with pytest.raises(ValidationError, match="Unable to parse datetime"):
+            parse_webhook({**payload, "date": value})
+
 
 class TestWebhookSubscriptionRequest:
     def test_https_required(self):